@@ -0,0 +1,208 @@
+# -------------------------------------------------
+# Scheduler benchmark suite
+# -------------------------------------------------
+# Times every registered algorithm (the core shared by the GUI, the CLIs and
+# the batch runners) over a grid of workload sizes, arrival/burst
+# distributions and Round Robin quanta. Wall time and peak traced memory go
+# to a JSON results file, which can be checked against a stored baseline:
+#
+#   python benchmarks/bench_schedulers.py --out bench.json
+#   python benchmarks/bench_schedulers.py --save-baseline benchmarks/baseline.json
+#   python benchmarks/bench_schedulers.py --baseline benchmarks/baseline.json
+#
+# The comparison exits with status 1 when any case got slower than the
+# baseline by more than --tolerance.
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from registry import ALGORITHMS  # noqa: E402
+from utils import ProcessTable  # noqa: E402
+
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUANTA = (1, 2, 4, 8)
+
+
+# -------------------------------------------------
+# Workload distributions
+# -------------------------------------------------
+def _uniform(rng, n):
+    # Same shape as utils.random_workload, with arrivals spread over ~n/3
+    arrival = rng.integers(0, max(30, n // 3) + 1, n)
+    burst = rng.integers(1, 11, n)
+    return arrival, burst
+
+
+def _bursty(rng, n):
+    # Arrivals come in a few large waves
+    waves = rng.integers(0, max(1, n // 1000) + 1, n) * 50
+    return waves, rng.integers(1, 11, n)
+
+
+def _heavy_tail(rng, n):
+    # Mostly short jobs with a Pareto tail of very long ones
+    arrival = rng.integers(0, max(30, n // 3) + 1, n)
+    burst = np.minimum(1 + rng.pareto(1.5, n) * 2, 10_000).astype(np.int64)
+    return arrival, burst
+
+
+def _sparse(rng, n):
+    # Gaps between arrivals longer than the bursts, so the CPU goes idle
+    arrival = np.cumsum(rng.integers(5, 20, n))
+    return arrival, rng.integers(1, 6, n)
+
+
+DISTRIBUTIONS: Dict[str, Callable] = {
+    "uniform": _uniform,
+    "bursty": _bursty,
+    "heavy_tail": _heavy_tail,
+    "sparse": _sparse,
+}
+
+
+def make_workload(dist: str, n: int, seed: int = 0) -> ProcessTable:
+    rng = np.random.default_rng(seed)
+    arrival, burst = DISTRIBUTIONS[dist](rng, n)
+    priority = rng.integers(1, 11, n)
+    return ProcessTable(np.arange(1, n + 1), arrival, burst, priority)
+
+
+# -------------------------------------------------
+# Measurement
+# -------------------------------------------------
+def measure(func, table: ProcessTable, args: tuple, repeat: int) -> Dict[str, float]:
+    """Best wall time over `repeat` runs, then peak traced memory of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        table.reset()
+        t0 = time.perf_counter()
+        func(table, *args)
+        best = min(best, time.perf_counter() - t0)
+
+    # Separate run: tracemalloc slows allocation-heavy code down
+    table.reset()
+    tracemalloc.start()
+    try:
+        func(table, *args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_s": best, "peak_bytes": peak}
+
+
+def run_suite(sizes, distributions, quanta, algorithms, repeat: int,
+              seed: int = 0) -> List[Dict]:
+    results = []
+
+    for dist in distributions:
+        for n in sizes:
+            table = make_workload(dist, n, seed)
+            repeats = repeat if n <= 100_000 else 1
+            for name in algorithms:
+                algo = ALGORITHMS[name]
+                for quantum in (quanta if algo.params else (None,)):
+                    args = algo.bind(quantum=quantum) if quantum is not None else ()
+                    stats = measure(algo.func, table, args, repeats)
+                    row = {"algorithm": name, "distribution": dist, "n": n, "quantum": quantum}
+                    row.update(stats)
+                    results.append(row)
+                    print(f"{case_id(row):<58} {stats['wall_s'] * 1000:10.2f} ms "
+                          f"{stats['peak_bytes'] / 2**20:9.1f} MiB", flush=True)
+    return results
+
+
+# -------------------------------------------------
+# Results files
+# -------------------------------------------------
+def case_id(row: Dict) -> str:
+    quantum = f"/q={row['quantum']}" if row["quantum"] is not None else ""
+    return f"{row['algorithm']}/{row['distribution']}/n={row['n']}{quantum}"
+
+
+def write_results(results: List[Dict], path: str):
+    doc = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(doc, f, indent=2)
+
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float,
+            min_wall: float) -> List[str]:
+    """Return one message per case that is slower than the baseline beyond `tolerance`."""
+    with open(baseline_path) as f:
+        baseline = {case_id(row): row for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in results:
+        base = baseline.get(case_id(row))
+        if base is None:
+            continue
+        # Very short cases are dominated by timer noise
+        if max(row["wall_s"], base["wall_s"]) < min_wall:
+            continue
+        ratio = row["wall_s"] / base["wall_s"] if base["wall_s"] else float("inf")
+        if ratio > tolerance:
+            regressions.append(f"{case_id(row)}: {base['wall_s'] * 1000:.2f} ms -> "
+                               f"{row['wall_s'] * 1000:.2f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None) -> Optional[int]:
+    parser = argparse.ArgumentParser(description="Benchmark the CPU scheduling algorithms")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS),
+                        choices=list(DISTRIBUTIONS))
+    parser.add_argument("--quanta", type=int, nargs="+", default=list(QUANTA),
+                        help="Round Robin quanta")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--quick", action="store_true", help="sizes up to 10^4 only")
+    parser.add_argument("--out", default="bench_results.json", help="results JSON file")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="also write the results to this baseline file")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="slowdown ratio that counts as a regression")
+    parser.add_argument("--min-wall", type=float, default=0.005,
+                        help="ignore cases faster than this many seconds when comparing")
+    args = parser.parse_args(argv)
+
+    sizes = [n for n in args.sizes if n <= 10_000] if args.quick else args.sizes
+    results = run_suite(sizes, args.distributions, args.quanta, args.algorithms, args.repeat)
+
+    write_results(results, args.out)
+    if args.save_baseline:
+        write_results(results, args.save_baseline)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance, args.min_wall)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,55 @@
 # animation_widget.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
-from PyQt5.QtGui import QPainter, QColor, QBrush, QFont
-from PyQt5.QtCore import QTimer, QRectF, Qt, pyqtSignal
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy, QLabel, QComboBox, QPushButton, QSlider,
+    QWIDGETSIZE_MAX
+)
+from PyQt5.QtGui import QPainter, QColor, QBrush, QFont, QImage, QPixmap
+from PyQt5.QtCore import QElapsedTimer, QTimer, QRect, QRectF, Qt, pyqtSignal
 import random
-from typing import List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Tuple
+
+from utils import seconds_to_time
+
+# Layout: the timeline sits at Y0, then one row per gantt segment
+Y0 = 40
+BAR_TOP = Y0 + 80
+BAR_H = 36
+ROW_H = BAR_H + 30
+
+# Qt caps widget heights at QWIDGETSIZE_MAX; leave room for the controls
+# and the result table that share the scroll area. Long gantts get thinner
+# rows (down to MIN_ROW_H) so every segment still fits under the cap.
+MAX_CANVAS_H = QWIDGETSIZE_MAX - 4096
+MIN_ROW_H = 2
+
+MIN_TICK_PX = 30     # closest allowed spacing between labelled ticks
+MIN_ROUND_PX = 12    # narrower bars are drawn as plain rectangles
+MIN_LABEL_PX = 16    # narrower bars get no PID label
+MIN_LABEL_H = 12     # shorter bars get no PID label either
+
+SPEEDS = (1, 2, 5, 10, 50, 100, 500, 1000)
+MAX_SPEED = 1000
+
+MAX_TOOLTIP_VISITS = 20
+
+# Resolution of the scrubbing slider; QSlider only holds int32, so it
+# moves over a fixed range that is mapped onto the played total
+SLIDER_STEPS = 10000
+
+
+class _PidStats:
+    """Per-PID summary of the gantt, kept up to date as segments arrive."""
+    __slots__ = ("visits", "executed")
+
+    def __init__(self):
+        self.visits = []      # duration of each CPU visit, in order
+        self.executed = 0
+
+    def add(self, dur):
+        self.visits.append(dur)
+        self.executed += dur
 
 
 class AnimationWidget(QWidget):
@@ -12,6 +58,32 @@ class AnimationWidget(QWidget):
         super().__init__()
         self.inner = _AnimationCanvas()
         layout = QVBoxLayout()
+
+        # playback controls
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Speed"))
+        self.speed_box = QComboBox()
+        for speed in SPEEDS:
+            self.speed_box.addItem(f"{speed}x", speed)
+        self.speed_box.currentIndexChanged.connect(
+            lambda: self.inner.set_speed(self.speed_box.currentData())
+        )
+        controls.addWidget(self.speed_box)
+        self.skip_btn = QPushButton("Skip to End")
+        self.skip_btn.setStyleSheet("background-color:#0D3B66;color:white;padding:6px 10px;border-radius:5px;")
+        self.skip_btn.clicked.connect(self.inner.skip_to_end)
+        controls.addWidget(self.skip_btn)
+
+        # scrubbing: the slider position is a fraction of the played total
+        self.position = QSlider(Qt.Horizontal)
+        self.position.setRange(0, SLIDER_STEPS)
+        self.position.setValue(0)
+        self._total = 0
+        self.position.valueChanged.connect(self._seek_fraction)
+        controls.addWidget(self.position, 1)
+        self.inner.position_changed.connect(self._show_position)
+
+        layout.addLayout(controls)
         layout.addWidget(self.inner)
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
@@ -25,9 +97,32 @@ class AnimationWidget(QWidget):
     def stop(self):
         self.inner.stop()
 
+    def set_speed(self, speed):
+        index = self.speed_box.findData(speed)
+        if index >= 0:
+            self.speed_box.setCurrentIndex(index)
+        else:
+            self.inner.set_speed(speed)
+
+    def skip_to_end(self):
+        self.inner.skip_to_end()
+
+    def seek(self, t):
+        self.inner.seek(t)
+
+    def _seek_fraction(self, value):
+        self.inner.seek(value * self._total / SLIDER_STEPS)
+
+    def _show_position(self, t, total):
+        self._total = total
+        self.position.blockSignals(True)
+        self.position.setValue(round(SLIDER_STEPS * t / total) if total else 0)
+        self.position.blockSignals(False)
+
 
 class _AnimationCanvas(QWidget):
     finished = pyqtSignal()
+    position_changed = pyqtSignal(float, float)   # simulated time, known total
     """Internal canvas that actually draws the animation"""
     def __init__(self):
         super().__init__()
@@ -35,28 +130,54 @@ class _AnimationCanvas(QWidget):
         self.setMinimumHeight(600)
 
         self.setMouseTracking(True)    # mouse hover track kare
-        self.bar_rects = []             # bars ka rectangle store karne ke liye
-
 
         self.gantt = []
-        self.proc_map = {}
+        self._source = None             # lazy segment stream, if any
+        self.end_time = 0
+        # _elapsed[i] = simulated time when segment i starts playing
+        # (durations of segments 0..i-1; idle gaps are not played)
+        self._elapsed = [0]
+        self.processes = []
+        self._pid_index = None          # pid -> position in processes, built on first hover
+        self.pid_stats = {}
         self.colors = {}
 
+        # Static layer (background, axis, every bar but the animating one)
+        # for the visible area, re-rendered only when its inputs change
+        self._static = None
+        self._static_key = None
+
         self.timer = QTimer()
         self.timer.timeout.connect(self._tick)
+        # Progress follows real elapsed time, not the number of timer fires
+        self.clock = QElapsedTimer()
 
         self.time_unit_ms = 350
         self.fps = 10
+        self.speed = 1
 
         # animation state
         self.running = False
         self.current_index = 0
         self.block_elapsed_ms = 0
-        self.setMinimumHeight(max(600, 120 + len(self.gantt) * 70))
+        self.row_h = ROW_H
+        self.bar_h = BAR_H
+        self.rows_shown = 0             # rows that fit on the canvas
+        self._fit_height()
         self.update()
         # drawing settings
         self.timeline_origin = 40
         self.font = QFont("Arial", 10, QFont.Bold)
+        self.label_font = QFont("Arial", 10)
+        self.clock_font = QFont("Arial", 11, QFont.Bold)
+        self.background = QColor(245, 245, 245)
+        self.axis_color = QColor(70, 70, 70)
+        self.outline_color = QColor(60, 60, 60)
+        self.empty_color = QColor(225, 225, 225)
+        self.highlight_color = QColor(255, 140, 0)
+        self.clock_color = QColor(50, 50, 50)
+        self.light_text = QColor(255, 255, 255)
+        self.dark_text = QColor(0, 0, 0)
 
         self.timer.setInterval(self.fps)
 
@@ -74,16 +195,120 @@ class _AnimationCanvas(QWidget):
         if not self.preserve_state:
             self.current_index = 0
             self.block_elapsed_ms = 0
-        
 
-    def play(self, gantt_list: List[Tuple[str, int, int]], processes, time_unit_ms=350, preserve_state=False):
-        if not gantt_list:
+    def set_speed(self, speed):
+        """Playback speed multiplier, from 1x to MAX_SPEED x."""
+        self.speed = min(MAX_SPEED, max(1, speed))
+
+    def skip_to_end(self):
+        """Jump straight to the finished chart with a single repaint."""
+        if not self.running:
+            return
+        self._ensure(float("inf"))
+        self.current_index = len(self.gantt)
+        self.block_elapsed_ms = 0
+        self._emit_position()
+        self._finish()
+        self.update()
+
+    def sim_time(self):
+        """Simulated time played so far, in O(1) from the prefix sums."""
+        t = self._elapsed[min(self.current_index, len(self.gantt))]
+        if self.current_index < len(self.gantt):
+            t += self.block_elapsed_ms / self.time_unit_ms
+        return t
+
+    def seek(self, t):
+        """
+        Jump to simulated time `t` without replaying earlier segments.
+
+        The target segment is found by bisecting the prefix sums; a lazy
+        stream is only read as far as `t` requires.
+        """
+        t = max(0, t)
+        while self._elapsed[-1] <= t and self._source is not None:
+            self._ensure(len(self.gantt))
+
+        idx = bisect_right(self._elapsed, t) - 1
+        if idx >= len(self.gantt):
+            self.current_index = len(self.gantt)
+            self.block_elapsed_ms = 0
+        else:
+            self.current_index = idx
+            self.block_elapsed_ms = (t - self._elapsed[idx]) * self.time_unit_ms
+        self.clock.restart()
+        self._emit_position()
+        self.update()
+
+    def _emit_position(self):
+        self.position_changed.emit(self.sim_time(), self._elapsed[-1])
+
+    def _finish(self):
+        if not self.preserve_state:
+            self.stop()
+        else:
+            self.running = False  # animation complete but preserve bars
+            self.timer.stop()
+        # Emit finished signal once
+        self.finished.emit()
+
+    def _ensure(self, index):
+        """Pull segments from the stream until `index` exists; False if it never will."""
+        pulled = False
+        while index >= len(self.gantt) and self._source is not None:
+            try:
+                seg = next(self._source)
+            except StopIteration:
+                self._source = None
+                break
+            self.gantt.append(seg)
+            self.assign_color(seg[0])
+            self._add_stats(seg)
+            self._elapsed.append(self._elapsed[-1] + seg[2])
+            self.end_time = max(self.end_time, seg[1] + seg[2])
+            pulled = True
+        if pulled:
+            self._fit_height()
+        return index < len(self.gantt)
+
+    def _add_stats(self, seg):
+        stats = self.pid_stats.get(seg[0])
+        if stats is None:
+            stats = self.pid_stats[seg[0]] = _PidStats()
+        stats.add(seg[2])
+
+    def _fit_height(self):
+        n = len(self.gantt)
+        room = MAX_CANVAS_H - BAR_TOP
+        self.row_h = min(ROW_H, max(MIN_ROW_H, room // max(1, n)))
+        self.bar_h = max(1, BAR_H * self.row_h // ROW_H)
+        # Even at MIN_ROW_H, rows past the cap are played but not drawn
+        self.rows_shown = min(n, room // self.row_h)
+        self.setMinimumHeight(max(600, BAR_TOP + self.rows_shown * self.row_h))
+
+    def play(self, gantt_list: Iterable[Tuple[str, int, int]], processes, time_unit_ms=350, preserve_state=False):
+        # A list is drawn up front; any other iterable is consumed lazily,
+        # one segment at a time, as the animation reaches it
+        self.pid_stats = {}
+        if isinstance(gantt_list, list):
+            self.gantt, self._source = gantt_list, None
+            for seg in gantt_list:
+                self._add_stats(seg)
+            self._elapsed = [0, *accumulate(d for _, _, d in gantt_list)]
+            self.end_time = max((s + d for _, s, d in gantt_list), default=0)
+            self._fit_height()
+        else:
+            self.gantt, self._source = [], iter(gantt_list)
+            self.end_time = 0
+            self._elapsed = [0]
+        self._static_key = None
+        if not self._ensure(0):
             return
 
         self.preserve_state = preserve_state
-        self.gantt = gantt_list
-        self.proc_map = {p.pid: p for p in processes}
-        for pid, _, _ in gantt_list:
+        self.processes = processes
+        self._pid_index = None
+        for pid, _, _ in self.gantt:
             self.assign_color(pid)
 
         self.time_unit_ms = time_unit_ms
@@ -95,160 +320,244 @@ class _AnimationCanvas(QWidget):
         if self.timer.isActive():
             self.timer.stop()
 
+        self.clock.start()
         self.timer.start()
+        self._emit_position()
         self.update()
 
-        self.setMinimumHeight(max(600, 120 + len(gantt_list) * 70))
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
     def _tick(self):
         if not self.running:
             return
 
-        if self.current_index >= len(self.gantt):
-            if not self.preserve_state:
-                self.stop()
-            else:
-                self.running = False  # animation complete but preserve bars
-             # Emit finished signal once
-            self.finished.emit()
-            return
-
-        pid, start, dur = self.gantt[self.current_index]
-        block_ms = dur * self.time_unit_ms
-
-        self.block_elapsed_ms += self.fps
-
-        if self.block_elapsed_ms >= block_ms:
+        # Advance by the real time since the last frame, crossing as many
+        # segments as it covers
+        self.block_elapsed_ms += self.clock.restart() * self.speed
+        start_index = self.current_index
+        while True:
+            if not self._ensure(self.current_index):
+                self.block_elapsed_ms = 0
+                self.update()
+                self._finish()
+                return
+            block_ms = self.gantt[self.current_index][2] * self.time_unit_ms
+            if self.block_elapsed_ms < block_ms:
+                break
+            self.block_elapsed_ms -= block_ms
             self.current_index += 1
-            self.block_elapsed_ms = 0
 
-        self.update()
+        self._emit_position()
+        if self.current_index != start_index:
+            self.update()
+        else:
+            # Only the animating bar and the clock changed
+            self.update(self._bar_rect(self.current_index).adjusted(-3, -3, 3, 3).toAlignedRect())
+            self.update(self._clock_rect())
+
+    # ---------------------------------------------
+    # Geometry
+    # ---------------------------------------------
+    def _scale(self):
+        usable_width = max(300, self.width() - self.timeline_origin - 40)
+        return usable_width / max(1, self.end_time)
+
+    def _bar_rect(self, idx, scale=None):
+        _, start, dur = self.gantt[idx]
+        scale = self._scale() if scale is None else scale
+        return QRectF(self.timeline_origin + start * scale, BAR_TOP + idx * self.row_h,
+                      dur * scale, self.bar_h)
+
+    def bar_center_y(self, idx) -> int:
+        """Canvas y of the middle of row `idx`."""
+        return BAR_TOP + idx * self.row_h + self.bar_h // 2
+
+    def _rows_in(self, rect):
+        """Indices of the gantt rows that intersect `rect`."""
+        first = max(0, (rect.top() - BAR_TOP - self.bar_h) // self.row_h)
+        last = min(self.rows_shown, (rect.bottom() - BAR_TOP) // self.row_h + 1)
+        return range(first, max(first, last))
+
+    def _bar_at(self, pos):
+        """
+        Index of the bar under `pos`, or None.
+
+        Bars sit one per row, so the row comes straight from y and only
+        that bar's x range needs checking.
+        """
+        row = int((pos.y() - BAR_TOP) // self.row_h)
+        if row < 0 or row >= self.rows_shown:
+            return None
+        if self._bar_rect(row).contains(pos):
+            return row
+        return None
+
+    def _clock_rect(self):
+        return QRect(self.width() - 200, 0, 200, Y0)
+
+    @staticmethod
+    def _tick_step(scale):
+        """Smallest 1/2/5 x 10^k time step whose ticks are MIN_TICK_PX apart."""
+        step = 1
+        while True:
+            for mult in (1, 2, 5):
+                if step * mult * scale >= MIN_TICK_PX:
+                    return step * mult
+            step *= 10
+
+    # ---------------------------------------------
+    # Drawing
+    # ---------------------------------------------
+    def _draw_bar(self, painter, idx, rect, fill_w):
+        pid = self.gantt[idx][0]
+        rounded = rect.width() >= MIN_ROUND_PX and rect.height() >= MIN_ROUND_PX
+
+        # background bar
+        painter.setPen(self.outline_color)
+        painter.setBrush(self.empty_color)
+        if rounded:
+            painter.drawRoundedRect(rect, 6, 6)
+        else:
+            painter.drawRect(rect)
+
+        # fill progress
+        if fill_w > 0:
+            fill = QRectF(rect.x(), rect.y(), fill_w, rect.height())
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(self.colors.get(pid)))
+            if rounded:
+                painter.drawRoundedRect(fill, 6, 6)
+            else:
+                painter.drawRect(fill)
+
+        # PID text
+        if rect.width() >= MIN_LABEL_PX and rect.height() >= MIN_LABEL_H:
+            painter.setPen(self.light_text if fill_w > 40 else self.dark_text)
+            painter.setFont(self.label_font)
+            painter.drawText(QRectF(rect.x() + 5, rect.y(), rect.width() - 10, rect.height()),
+                             Qt.AlignVCenter | Qt.AlignLeft, str(pid))
+
+    def _render_static(self, area: QRect) -> QPixmap:
+        """Background, axis and every bar except the animating one, for `area`."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(area.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.background)
+
+        painter = QPainter(pixmap)
+        painter.translate(-area.topLeft())
+        painter.setRenderHint(QPainter.Antialiasing)
+        scale = self._scale()
+
+        # timeline with adaptive tick spacing
+        if area.top() <= Y0 + 45:
+            painter.setPen(self.axis_color)
+            painter.drawLine(self.timeline_origin, Y0 + 20, self.width() - 40, Y0 + 20)
+            step = self._tick_step(scale)
+            for t in range(0, self.end_time + 1, step):
+                x = int(self.timeline_origin + t * scale)
+                painter.drawLine(x, Y0 + 15, x, Y0 + 25)
+                painter.drawText(x - 5, Y0 + 40, str(t))
+
+        for idx in self._rows_in(area):
+            rect = self._bar_rect(idx, scale)
+            done = idx < self.current_index
+            self._draw_bar(painter, idx, rect, rect.width() if done else 0)
+
+        painter.end()
+        return pixmap
 
     def paintEvent(self, event):
+        area = self.visibleRegion().boundingRect()
+        if area.isEmpty():
+            return
         painter = QPainter(self)
+        self._paint(painter, area)
+        painter.end()
+
+    def render_frame(self, image: QImage, top=0):
+        """
+        Draw the current state into `image`, showing the canvas from y = `top`.
+
+        Works on a canvas that was never shown, e.g. under the offscreen
+        platform; consecutive frames reuse the cached static layer.
+        """
+        area = QRect(0, top, image.width(), image.height())
+        image.fill(self.background)
+        painter = QPainter(image)
+        painter.translate(0, -top)
+        self._paint(painter, area)
+        if top > 0:
+            # The clock scrolled out of view; repeat it at the top of the frame
+            painter.fillRect(self._clock_rect().translated(0, top), self.background)
+            self._draw_clock(painter, top)
+        painter.end()
+
+    def _paint(self, painter, area: QRect):
+        key = (area, self.width(), self.end_time, len(self.gantt), self.current_index)
+        if key != self._static_key:
+            self._static = self._render_static(area)
+            self._static_key = key
+
+        painter.drawPixmap(area.topLeft(), self._static)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        painter.fillRect(self.rect(), QColor(245, 245, 245))
-
-        # timeline
-        y0 = 40
-        painter.setPen(QColor(70, 70, 70))
-        painter.drawLine(self.timeline_origin, y0 + 20, self.width() - 40, y0 + 20)
-
-        # ===== HEIGHT FIX START =====
-        total_bars = len(self.gantt)          # ✅ DEFINE HERE
-        bar_h = 36
-        canvas_height = 120 + total_bars * (bar_h + 30)
-        self.setMinimumHeight(max(600, canvas_height))
-        # ===== HEIGHT FIX END =====
-
-        # find total time
-        end_time = 0
-        for _, s, d in self.gantt:
-            end_time = max(end_time, s + d)
-
-        usable_width = max(300, self.width() - self.timeline_origin - 40)
-        scale = usable_width / max(1, end_time)
-
-        # draw time ticks
-        for t in range(0, end_time + 1):
-            x = self.timeline_origin + t * scale
-            painter.drawLine(int(x), y0 + 15, int(x), y0 + 25)
-            painter.drawText(int(x) - 5, y0 + 40, str(t))
-
-        self.bar_rects.clear()  # har paintEvent ke start me reset kare
-
-        # draw bars
-        bar_y = y0 + 80
-        bar_h = 36
-
-        for idx, (pid, start, dur) in enumerate(self.gantt):
-            x0 = self.timeline_origin + start * scale
-            full_w = dur * scale
-
-            if idx < self.current_index:
-                fill_w = full_w
-            elif idx == self.current_index:
-                block_ms = dur * self.time_unit_ms
-                frac = min(1.0, self.block_elapsed_ms / block_ms)
-                fill_w = full_w * frac
-            else:
-                fill_w = 0
-
-
-            rect = QRectF(x0, bar_y, full_w, bar_h)
-            self.bar_rects.append((rect, pid))  # store rectangle + PID
-
-   
-            # draw background bar
-            painter.setPen(QColor(60, 60, 60))
-            painter.setBrush(QColor(225, 225, 225))
-            painter.drawRoundedRect(QRectF(x0, bar_y, full_w, bar_h), 6, 6)
-
-            # fill progress
-            painter.setBrush(QBrush(self.colors.get(pid)))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(QRectF(x0, bar_y, fill_w, bar_h), 6, 6)
+        # the animating bar
+        idx = self.current_index
+        if idx < len(self.gantt) and idx in self._rows_in(area):
+            rect = self._bar_rect(idx)
+            block_ms = self.gantt[idx][2] * self.time_unit_ms
+            frac = min(1.0, self.block_elapsed_ms / block_ms) if block_ms > 0 else 1.0
+            self._draw_bar(painter, idx, rect, rect.width() * frac)
 
             # highlight running
-            if idx == self.current_index and self.running:
-                painter.setPen(QColor(255, 140, 0))
+            if self.running:
+                painter.setPen(self.highlight_color)
                 painter.setBrush(Qt.NoBrush)
-                painter.drawRoundedRect(QRectF(x0 - 2, bar_y - 2, full_w + 4, bar_h + 4), 8, 8)
-
-            # PID text
-            painter.setPen(QColor(255, 255, 255) if fill_w > 40 else QColor(0, 0, 0))
-            painter.setFont(QFont("Arial", 10))
-            painter.drawText(QRectF(x0 + 5, bar_y, full_w - 10, bar_h),
-                             Qt.AlignVCenter | Qt.AlignLeft, pid)
+                painter.drawRoundedRect(rect.adjusted(-2, -2, 2, 2), 8, 8)
 
-            bar_y += bar_h + 30
+        self._draw_clock(painter)
 
+    def _draw_clock(self, painter, top=0):
         # simulated time
-        sim_time = 0
-        for i in range(self.current_index):
-            sim_time += self.gantt[i][2]
-        if self.current_index < len(self.gantt):
-            sim_time += (self.block_elapsed_ms / self.time_unit_ms)
-
-        painter.setFont(QFont("Arial", 11, QFont.Bold))
-        painter.setPen(QColor(50, 50, 50))
-        from hmain import seconds_to_time   # top pe import
+        painter.setFont(self.clock_font)
+        painter.setPen(self.clock_color)
         painter.drawText(
             self.width() - 200,
-            25,
-            f"Time ≈ {seconds_to_time(sim_time)}"
+            top + 25,
+            f"Time ≈ {seconds_to_time(self.sim_time())}"
         )
 
-
     def mouseMoveEvent(self, event):
-        cursor = event.pos()
         tooltip_text = ""  # default
 
-        for rect, pid in self.bar_rects:
-            if rect.contains(cursor):
-                p = self.proc_map.get(pid)
-                if p:
-                    total_burst = p.burst
-                    remaining_burst = p.remaining
-                    executed_burst = total_burst - remaining_burst
-                    visits_details = [d for x, _, d in self.gantt if x == pid]
-                    num_visits = len(visits_details)
-
-                    # build tooltip text
-                    tooltip_text = (
-                        f"PID: {p.pid}\n"
-                        f"Total Burst: {total_burst}\n"
-                        f"Remaining Burst: {remaining_burst}\n"
-                        f"Total Executed Burst: {executed_burst}\n"
-                        f"CPU Visits: {num_visits}"
-                    )
-
-                    # add per-visit details only if more than 1 visit
-                    if num_visits > 1:
-                        tooltip_text += f"\nExecuted per Visit: {visits_details}"
-
-                break  # exit loop if we found the bar
-
-        self.setToolTip(tooltip_text)  # always safe to call
\ No newline at end of file
+        idx = self._bar_at(event.pos())
+        if idx is not None:
+            pid = self.gantt[idx][0]
+            if self._pid_index is None:
+                # A ProcessTable's pid column is read directly, without building rows
+                pids = getattr(self.processes, "pid", None)
+                pids = pids.tolist() if pids is not None else [p.pid for p in self.processes]
+                self._pid_index = {label: i for i, label in enumerate(pids)}
+            pos = self._pid_index.get(pid)
+            p = self.processes[pos] if pos is not None else None
+            if p is not None:
+                stats = self.pid_stats[pid]
+                num_visits = len(stats.visits)
+
+                # build tooltip text
+                tooltip_text = (
+                    f"PID: {p.pid}\n"
+                    f"Total Burst: {p.burst}\n"
+                    f"Remaining Burst: {p.burst - stats.executed}\n"
+                    f"Total Executed Burst: {stats.executed}\n"
+                    f"CPU Visits: {num_visits}"
+                )
+
+                # add per-visit details only if more than 1 visit
+                if num_visits > 1:
+                    shown = stats.visits[:MAX_TOOLTIP_VISITS]
+                    more = " ..." if num_visits > MAX_TOOLTIP_VISITS else ""
+                    tooltip_text += f"\nExecuted per Visit: {shown}{more}"
+
+        self.setToolTip(tooltip_text)  # always safe to call
@@ -0,0 +1,155 @@
+# -------------------------------------------------
+# Batch Monte Carlo runner
+# -------------------------------------------------
+# Runs the scheduling algorithms over many random workloads in a process
+# pool and collects one metrics row per (seed, algorithm, quantum).
+#
+#   python src/batch.py --runs 1000 --processes 50 --quantum 2 4 8 --out runs.csv
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from metrics import MetricsAccumulator
+from registry import ALGORITHMS
+from result_cache import open_cache
+from utils import random_workload
+
+METRICS = ("avg_tat", "avg_wt", "avg_rt", "p95_tat", "p95_wt", "p95_rt",
+           "p99_tat", "p99_wt", "p99_rt", "makespan", "segments")
+
+
+# -------------------------------------------------
+# Worker side
+# -------------------------------------------------
+def _run_seed(job) -> List[Dict]:
+    """Rebuild one workload from its seed and run every requested algorithm on it."""
+    seed, n_processes, algorithms, quanta, cache_dir = job
+    table = random_workload(n_processes, seed)
+    cache = open_cache(cache_dir) if cache_dir else None
+    rows = []
+
+    for algo in algorithms:
+        takes_quantum = any(p.name == "quantum" for p in ALGORITHMS[algo].params)
+        for quantum in (quanta if takes_quantum else (None,)):
+            table.reset()
+            params = {"quantum": quantum} if quantum is not None else {}
+            stats = MetricsAccumulator()
+            gantt = ALGORITHMS[algo].run(table, metrics=stats, cache=cache, **params)
+
+            row = {"seed": seed, "algorithm": algo, "quantum": quantum}
+            row.update(stats.summary())
+            row["makespan"] = int(table.completion_time.max()) if len(table) else 0
+            row["segments"] = len(gantt)
+            rows.append(row)
+
+    return rows
+
+
+# -------------------------------------------------
+# Public API
+# -------------------------------------------------
+def run_batch(seeds: Iterable[int], n_processes: int,
+              algorithms: Sequence[str] = tuple(ALGORITHMS),
+              quanta: Sequence[int] = (2,),
+              workers: Optional[int] = None,
+              chunksize: Optional[int] = None,
+              cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Run `algorithms` on one random workload per seed, in parallel.
+
+    Only (seed, size, algorithms, quanta) tuples cross the process boundary;
+    each worker regenerates its workload. Jobs are handed out in chunks to
+    keep IPC overhead low. With `cache_dir`, runs go through an on-disk
+    ResultCache shared by all workers, so repeated batches are not
+    recomputed. Returns one metrics row per run.
+    """
+    unknown = [a for a in algorithms if a not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"Unknown algorithm(s): {', '.join(unknown)}")
+
+    jobs = [(seed, n_processes, tuple(algorithms), tuple(quanta), cache_dir) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (workers * 4))
+
+    rows = []
+    if workers == 1:
+        for job in jobs:
+            rows.extend(_run_seed(job))
+        return rows
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(_run_seed, jobs, chunksize=chunksize):
+            rows.extend(chunk)
+    return rows
+
+
+def summarize(rows: List[Dict]) -> List[Dict]:
+    """Aggregate run rows into mean/std/min/max of each metric per (algorithm, quantum)."""
+    groups: Dict[tuple, List[Dict]] = {}
+    for row in rows:
+        groups.setdefault((row["algorithm"], row["quantum"]), []).append(row)
+
+    summary = []
+    for (algo, quantum), group in groups.items():
+        out = {"algorithm": algo, "quantum": quantum, "runs": len(group)}
+        for metric in METRICS:
+            values = np.array([r[metric] for r in group], dtype=np.float64)
+            out[f"{metric}_mean"] = float(values.mean())
+            out[f"{metric}_std"] = float(values.std())
+            out[f"{metric}_min"] = float(values.min())
+            out[f"{metric}_max"] = float(values.max())
+        summary.append(out)
+    return summary
+
+
+def write_csv(rows: List[Dict], path: str):
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo runs of the CPU scheduling algorithms")
+    parser.add_argument("--runs", type=int, default=1000, help="number of random workloads")
+    parser.add_argument("--seed", type=int, default=0, help="first workload seed")
+    parser.add_argument("--processes", type=int, default=5, help="processes per workload")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--quantum", type=int, nargs="+", default=[2], help="Round Robin quanta")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument("--cache-dir", help="reuse results stored in this directory")
+    parser.add_argument("--out", help="write every run to this CSV file")
+    parser.add_argument("--summary", help="write the aggregated table to this CSV file")
+    args = parser.parse_args(argv)
+
+    rows = run_batch(range(args.seed, args.seed + args.runs), args.processes,
+                     args.algorithms, args.quantum, args.workers, args.chunksize,
+                     args.cache_dir)
+    summary = summarize(rows)
+
+    if args.out:
+        write_csv(rows, args.out)
+    if args.summary:
+        write_csv(summary, args.summary)
+
+    for s in summary:
+        label = s["algorithm"] + (f" (q={s['quantum']})" if s["quantum"] is not None else "")
+        print(f"{label:<18} runs={s['runs']:<6} "
+              f"TAT={s['avg_tat_mean']:.2f}  WT={s['avg_wt_mean']:.2f}  RT={s['avg_rt_mean']:.2f}  "
+              f"p99 WT={s['p99_wt_mean']:.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
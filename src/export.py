@@ -0,0 +1,243 @@
+# -------------------------------------------------
+# Batch export of Gantt charts and animation frames
+# -------------------------------------------------
+# charts: one Gantt image per (workload, algorithm, quantum), rendered in a
+#         process pool through the headless renderer in gantt.py.
+# frames: a frame-accurate replay of the animation as a PNG sequence, drawn
+#         by the animation canvas on the offscreen Qt platform; the frame
+#         range is split across workers.
+#
+#   python src/export.py charts --seeds 0 1 2 --processes 20 --out-dir charts
+#   python src/export.py charts --workloads a.csv b.jsonl --algorithms fcfs rr --quantum 2 4
+#   python src/export.py frames --seed 0 --processes 10 --algorithm rr --fps 30 --out-dir frames
+#   python src/export.py frames --seed 0 --processes 5000 --cache-dir ~/.cache/cpu-scheduler
+import argparse
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from registry import ALGORITHMS, QUANTUM
+from result_cache import open_cache
+from utils import ProcessTable, random_workload
+
+# ("file", path) or ("seed", seed, n_processes); workers rebuild the
+# workload from this instead of receiving it pickled
+WorkloadSpec = Tuple
+
+FRAME_WIDTH = 1280
+FRAME_HEIGHT = 720
+
+
+def load_spec(spec: WorkloadSpec) -> ProcessTable:
+    if spec[0] == "file":
+        from loaders import load_workload
+        return load_workload(spec[1])
+    return random_workload(spec[2], spec[1])
+
+
+def spec_name(spec: WorkloadSpec) -> str:
+    return Path(spec[1]).stem if spec[0] == "file" else f"seed{spec[1]}"
+
+
+def _run(spec: WorkloadSpec, algo: str, quantum: Optional[int], cache_dir: Optional[str] = None):
+    table = load_spec(spec)
+    params = {"quantum": quantum} if quantum is not None else {}
+    cache = open_cache(cache_dir) if cache_dir else None
+    return table, ALGORITHMS[algo].run(table, cache=cache, **params)
+
+
+def _pool_map(func, jobs: List, workers: Optional[int]) -> List:
+    workers = min(workers or os.cpu_count() or 1, max(1, len(jobs)))
+    if workers == 1:
+        return [func(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, jobs))
+
+
+# -------------------------------------------------
+# Gantt charts
+# -------------------------------------------------
+def _render_chart(job) -> List[str]:
+    spec, algo, quantum, out_dir, tile_span, dpi, cache_dir = job
+    from gantt import render_gantt_image, render_gantt_tiles
+
+    _, gantt = _run(spec, algo, quantum, cache_dir)
+    suffix = f"_q{quantum}" if quantum is not None else ""
+    filename = os.path.join(out_dir, f"{spec_name(spec)}_{algo}{suffix}.png")
+    if tile_span:
+        return render_gantt_tiles(gantt, filename, tile_span, dpi)
+    return [render_gantt_image(gantt, filename, dpi)]
+
+
+def export_charts(specs: Sequence[WorkloadSpec], out_dir: str,
+                  algorithms: Sequence[str] = tuple(ALGORITHMS),
+                  quanta: Sequence[int] = (2,),
+                  workers: Optional[int] = None,
+                  tile_span: Optional[int] = None, dpi: int = 100,
+                  cache_dir: Optional[str] = None) -> List[str]:
+    """
+    Render a Gantt chart for every (workload, algorithm, quantum) in parallel.
+
+    Files are named `<workload>_<algorithm>[_q<quantum>].png`. Returns the
+    saved filenames, in job order. With `cache_dir`, schedules already
+    computed for the same workload are read back from an on-disk
+    ResultCache instead of being rerun.
+    """
+    unknown = [a for a in algorithms if a not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"Unknown algorithm(s): {', '.join(unknown)}")
+
+    jobs = []
+    for spec in specs:
+        for algo in algorithms:
+            for quantum in (quanta if ALGORITHMS[algo].params else (None,)):
+                jobs.append((spec, algo, quantum, out_dir, tile_span, dpi, cache_dir))
+    return [name for names in _pool_map(_render_chart, jobs, workers) for name in names]
+
+
+# -------------------------------------------------
+# Animation frames
+# -------------------------------------------------
+_app = None
+
+
+def _qt_app():
+    """The QApplication for this process, created on the offscreen platform if needed."""
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def _render_frames(job) -> List[str]:
+    spec, algo, quantum, out_dir, first, last, opts = job
+    _qt_app()
+    from PyQt5.QtGui import QColor, QImage
+    from animation_widget import _AnimationCanvas
+
+    table, gantt = _run(spec, algo, quantum, opts["cache_dir"])
+    canvas = _AnimationCanvas()
+    # Seeded colors, so every worker paints each pid the same way
+    rng = random.Random(0)
+    for pid, _, _ in gantt:
+        if pid not in canvas.colors:
+            canvas.colors[pid] = QColor(*(rng.randint(40, 220) for _ in range(3)))
+    canvas.play(gantt, table, time_unit_ms=opts["time_unit_ms"], preserve_state=True)
+    canvas.timer.stop()
+    canvas.resize(opts["width"], canvas.minimumHeight())
+
+    image = QImage(opts["width"], min(opts["height"], canvas.height()), QImage.Format_RGB32)
+    per_frame = opts["units_per_frame"]
+    saved = []
+    for k in range(first, last):
+        canvas.seek(k * per_frame)
+        # Keep the animating bar in view
+        row_mid = canvas.bar_center_y(canvas.current_index)
+        top = max(0, min(canvas.height() - image.height(), row_mid - image.height() // 2))
+        canvas.render_frame(image, top)
+        name = os.path.join(out_dir, f"frame_{k:06d}.png")
+        if not image.save(name):
+            raise OSError(f"Could not write {name}")
+        saved.append(name)
+    return saved
+
+
+def frame_count(gantt, units_per_frame: float) -> int:
+    """Frames for a whole replay, including the final, finished one."""
+    played = sum(d for _, _, d in gantt)
+    return math.ceil(played / units_per_frame) + 1
+
+
+def export_frames(spec: WorkloadSpec, algo: str, out_dir: str, quantum: Optional[int] = None,
+                  fps: int = 30, speed: float = 1.0, time_unit_ms: int = 350,
+                  width: int = FRAME_WIDTH, height: int = FRAME_HEIGHT,
+                  workers: Optional[int] = None, cache_dir: Optional[str] = None) -> List[str]:
+    """
+    Render the animation of one run as `frame_000000.png`, ... in `out_dir`.
+
+    Frame k shows the animation at k / fps seconds of playback at `speed`,
+    with `time_unit_ms` per unit of simulated time as in the GUI. Workers
+    each rebuild the run and draw a contiguous range of frames, so the
+    canvas' static layer is reused between frames of the same segment.
+    With `cache_dir`, the schedule is computed once here and the workers
+    read it back from the on-disk ResultCache.
+    """
+    quantum = (QUANTUM.default if quantum is None else quantum) if ALGORITHMS[algo].params else None
+    _, gantt = _run(spec, algo, quantum, cache_dir)
+    if not gantt:
+        raise ValueError("Empty gantt data")
+    os.makedirs(out_dir, exist_ok=True)
+
+    opts: Dict = {
+        "units_per_frame": speed * 1000 / (fps * time_unit_ms),
+        "time_unit_ms": time_unit_ms, "width": width, "height": height,
+        "cache_dir": cache_dir,
+    }
+    total = frame_count(gantt, opts["units_per_frame"])
+    workers = min(workers or os.cpu_count() or 1, total)
+    bounds = [total * i // workers for i in range(workers + 1)]
+    jobs = [(spec, algo, quantum, out_dir, lo, hi, opts)
+            for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+    return [name for names in _pool_map(_render_frames, jobs, workers) for name in names]
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def _specs(args) -> List[WorkloadSpec]:
+    specs = [("file", path) for path in args.workloads or ()]
+    specs += [("seed", seed, args.processes) for seed in args.seeds or ()]
+    return specs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Gantt charts and animation frames")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    charts = sub.add_parser("charts", help="one Gantt image per workload and algorithm")
+    charts.add_argument("--workloads", nargs="+", help="CSV/JSONL/binary workload files")
+    charts.add_argument("--seeds", type=int, nargs="+", help="random workload seeds")
+    charts.add_argument("--processes", type=int, default=10, help="processes per random workload")
+    charts.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    charts.add_argument("--quantum", type=int, nargs="+", default=[2], help="Round Robin quanta")
+    charts.add_argument("--tile-span", type=int, help="split charts into tiles of this many time units")
+    charts.add_argument("--dpi", type=int, default=100)
+
+    frames = sub.add_parser("frames", help="animation replay as a PNG sequence")
+    frames.add_argument("--workload", help="CSV/JSONL/binary workload file")
+    frames.add_argument("--seed", type=int, default=0, help="random workload seed")
+    frames.add_argument("--processes", type=int, default=10, help="processes in the random workload")
+    frames.add_argument("--algorithm", default="fcfs", choices=list(ALGORITHMS))
+    frames.add_argument("--quantum", type=int, default=2, help="Round Robin quantum")
+    frames.add_argument("--fps", type=int, default=30)
+    frames.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier")
+    frames.add_argument("--width", type=int, default=FRAME_WIDTH)
+    frames.add_argument("--height", type=int, default=FRAME_HEIGHT)
+
+    for p in (charts, frames):
+        p.add_argument("--out-dir", default="export")
+        p.add_argument("--workers", type=int, default=None)
+        p.add_argument("--cache-dir", help="reuse schedules stored in this directory")
+    args = parser.parse_args(argv)
+
+    if args.command == "charts":
+        specs = _specs(args)
+        if not specs:
+            parser.error("charts needs --workloads and/or --seeds")
+        saved = export_charts(specs, args.out_dir, args.algorithms, args.quantum,
+                              args.workers, args.tile_span, args.dpi, args.cache_dir)
+    else:
+        spec = ("file", args.workload) if args.workload else ("seed", args.seed, args.processes)
+        saved = export_frames(spec, args.algorithm, args.out_dir, args.quantum, args.fps,
+                              args.speed, width=args.width, height=args.height,
+                              workers=args.workers, cache_dir=args.cache_dir)
+    print(f"Wrote {len(saved)} image(s) to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
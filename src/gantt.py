@@ -1,19 +1,41 @@
-import matplotlib.pyplot as plt
-from typing import List, Tuple
+import numpy as np
+from typing import List, Tuple, Union
 from pathlib import Path
 
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+
+from gantt_trace import Trace
+
 
 # Renders a static Gantt image from a gantt list
-# gantt: List[Tuple[pid, start, duration]]
+# gantt: List[Tuple[pid, start, duration]] or a memory-mapped gantt_trace.Trace
+#
+# Figures are drawn on their own Agg canvas, never through pyplot, so
+# rendering works headless and from worker threads or processes. All bars go
+# into one PolyCollection, bars closer together than a pixel are merged
+# first, and pid labels are drawn only on bars wide enough to hold them.
 
+FIG_WIDTH = 10             # inches
+ROW_HEIGHT = 0.6           # inches per pid row
+MIN_FIG_HEIGHT = 2.5       # inches
+MAX_FIG_HEIGHT_PX = 30000  # Agg can't draw past 2**16 pixels in either direction
+BAR_HEIGHT = 0.6           # fraction of a row
+FONT_SIZE = 9              # points
+CHAR_WIDTH = 0.6           # average glyph width, in ems
 
-def render_gantt_image(gantt: List[Tuple[str, int, int]], filename: str = 'examples/gantt.png') -> str:
+
+def render_gantt_image(gantt: Union[List[Tuple[str, int, int]], Trace], filename: str = 'examples/gantt.png',
+                       dpi: int = 100) -> str:
     """
     Render a Gantt chart image from gantt data and save it to `filename`.
 
     Args:
-        gantt: list of tuples (pid, start, duration)
+        gantt: list of tuples (pid, start, duration), or a Trace from read_trace()
         filename: path to save the image
+        dpi: resolution of the saved image
 
     Returns:
         the filename that was saved
@@ -22,32 +44,148 @@ def render_gantt_image(gantt: List[Tuple[str, int, int]], filename: str = 'examp
         ValueError if gantt is empty
         Any exception raised by matplotlib/file IO will propagate.
     """
-    if not gantt:
-        raise ValueError('Empty gantt data')
+    chart = _GanttData(gantt)
+    return chart.render(filename, chart.time_range(), dpi)
+
+
+def render_gantt_tiles(gantt: Union[List[Tuple[str, int, int]], Trace], filename: str = 'examples/gantt.png',
+                       tile_span: int = 1000, dpi: int = 100) -> List[str]:
+    """
+    Render a long timeline as a row of images, `tile_span` time units each.
 
-    # Ensure output directory exists
+    Tiles share the same pid rows and are named `<stem>_000<suffix>`,
+    `<stem>_001<suffix>`, ... next to `filename`.
+
+    Returns:
+        the filenames that were saved, in time order
+    """
+    if tile_span < 1:
+        raise ValueError(f'tile_span must be at least 1, got {tile_span}')
+    chart = _GanttData(gantt)
+    lo, hi = chart.time_range()
     out_path = Path(filename)
-    if out_path.parent and not out_path.parent.exists():
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Determine unique pids and assign rows
-    pids = sorted(list({pid for pid, _, _ in gantt}))
-    pid_index = {pid: idx for idx, pid in enumerate(pids)}
-
-    fig_height = max(2.5, 0.6 * len(pids))
-    fig, ax = plt.subplots(figsize=(10, fig_height))
-
-    for pid, start, dur in gantt:
-        y = pid_index[pid]
-        ax.barh(y, dur, left=start, height=0.6)
-        # place the pid label centered in the bar (if the bar is too small, it may overlap)
-        ax.text(start + dur / 2, y, pid, va='center', ha='center', color='white', fontsize=9)
-
-    ax.set_yticks(list(range(len(pids))))
-    ax.set_yticklabels(pids)
-    ax.set_xlabel('Time')
-    ax.invert_yaxis()
-    plt.tight_layout()
-    fig.savefig(str(out_path))
-    plt.close(fig)
-    return str(out_path)
+    count = max(1, -(-(hi - lo) // tile_span))
+    digits = max(3, len(str(count - 1)))
+
+    saved = []
+    for k in range(count):
+        t0 = lo + k * tile_span
+        name = out_path.with_name(f'{out_path.stem}_{k:0{digits}d}{out_path.suffix}')
+        saved.append(chart.render(name, (t0, t0 + tile_span), dpi))
+    return saved
+
+
+# -------------------------------------------------
+# Drawing
+# -------------------------------------------------
+class _GanttData:
+    """Gantt columns with each segment mapped to its (sorted) pid row."""
+
+    def __init__(self, gantt):
+        if not len(gantt):
+            raise ValueError('Empty gantt data')
+        labels, pid_ids, starts, durations = _gantt_columns(gantt)
+
+        # Determine unique pids and assign rows
+        self.pids = sorted(labels)
+        pid_index = {pid: idx for idx, pid in enumerate(self.pids)}
+        row_of_id = np.array([pid_index[pid] for pid in labels], dtype=np.int64)
+        rows = row_of_id[pid_ids]
+
+        # Row-major, time-ordered, for merging neighbours within a row
+        order = np.lexsort((starts, rows))
+        self.rows = rows[order]
+        self.starts = np.asarray(starts, dtype=np.int64)[order]
+        self.ends = self.starts + np.asarray(durations, dtype=np.int64)[order]
+
+    def time_range(self) -> Tuple[int, int]:
+        lo = int(self.starts.min())
+        return lo, max(int(self.ends.max()), lo + 1)
+
+    def render(self, filename, xlim: Tuple[int, int], dpi: int) -> str:
+        # Ensure output directory exists
+        out_path = Path(filename)
+        if out_path.parent and not out_path.parent.exists():
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        n_rows = len(self.pids)
+        fig_height = min(max(MIN_FIG_HEIGHT, ROW_HEIGHT * n_rows), MAX_FIG_HEIGHT_PX / dpi)
+        row_px = fig_height * dpi / n_rows
+        font_px = FONT_SIZE * dpi / 72
+
+        fig = Figure(figsize=(FIG_WIDTH, fig_height), dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.set_xlim(*xlim)
+        ax.set_ylim(n_rows - 0.5, -0.5)
+        ax.set_xlabel('Time')
+        ax.set_yticks([])
+
+        # Fixed margins instead of tight_layout(), which would lay out every
+        # label an extra time; the plot width in pixels is then known up front
+        show_rows = row_px >= font_px
+        label_px = max(len(str(pid)) for pid in self.pids) * CHAR_WIDTH * font_px
+        left = (label_px + 12 if show_rows else 2.5 * font_px) / (FIG_WIDTH * dpi)
+        fig.subplots_adjust(left=left, right=1 - 15 / (FIG_WIDTH * dpi),
+                            bottom=4 * font_px / (fig_height * dpi),
+                            top=1 - font_px / (fig_height * dpi))
+        per_px = (xlim[1] - xlim[0]) / (FIG_WIDTH * dpi * (fig.subplotpars.right - left))
+
+        # Row names as plain text; thousands of axis ticks are much slower
+        if show_rows:
+            transform = ax.get_yaxis_transform()
+            for y, pid in enumerate(self.pids):
+                ax.text(-0.005, y, pid, transform=transform, va='center', ha='right',
+                        fontsize=FONT_SIZE)
+        else:
+            ax.set_ylabel(f'{n_rows:,} processes')
+
+        rows, starts, ends = self._merged(xlim, per_px)
+        ends = np.maximum(ends, starts + per_px)   # at least a pixel wide
+        # Rows thinner than a couple of pixels are drawn full height so
+        # neighbouring rows blend into visible bands instead of vanishing
+        half = (BAR_HEIGHT if row_px >= 2 else 1.0) / 2
+        verts = np.empty((len(rows), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = starts
+        verts[:, 2, 0] = verts[:, 3, 0] = ends
+        verts[:, 0, 1] = verts[:, 3, 1] = rows - half
+        verts[:, 1, 1] = verts[:, 2, 1] = rows + half
+        colors = to_rgba_array([f'C{i}' for i in range(10)])[rows % 10]
+        ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors='none'), autolim=False)
+
+        # Label only bars that can hold their pid
+        if show_rows:
+            label_len = np.array([len(str(pid)) for pid in self.pids])[rows]
+            fits = (ends - starts) / per_px >= label_len * CHAR_WIDTH * font_px + 4
+            for y, center in zip(rows[fits].tolist(), ((starts + ends) / 2)[fits].tolist()):
+                ax.text(center, y, self.pids[y], va='center', ha='center', color='white',
+                        fontsize=FONT_SIZE, clip_on=True)
+
+        fig.savefig(str(out_path))
+        return str(out_path)
+
+    def _merged(self, xlim, per_px):
+        """Bars clipped to `xlim`, with same-row bars less than a pixel apart merged into one."""
+        visible = (self.ends > xlim[0]) & (self.starts < xlim[1])
+        rows = self.rows[visible]
+        starts = np.maximum(self.starts[visible], xlim[0])
+        ends = np.minimum(self.ends[visible], xlim[1])
+        if not len(rows):
+            return rows, starts, ends
+
+        breaks = np.ones(len(rows), dtype=bool)
+        breaks[1:] = (rows[1:] != rows[:-1]) | (starts[1:] - ends[:-1] >= per_px)
+        first = np.flatnonzero(breaks)
+        return rows[first], starts[first], np.maximum.reduceat(ends, first)
+
+
+def _gantt_columns(gantt):
+    """Split a gantt list or a Trace into (pid labels, pid ids, starts, durations)."""
+    if isinstance(gantt, Trace):
+        return gantt.pids, gantt.pid_id, gantt.start, gantt.duration
+
+    ids = {}
+    pid_ids = [ids.setdefault(pid, len(ids)) for pid, _, _ in gantt]
+    return (list(ids), np.array(pid_ids, dtype=np.int64),
+            np.array([s for _, s, _ in gantt], dtype=np.int64),
+            np.array([d for _, _, d in gantt], dtype=np.int64))
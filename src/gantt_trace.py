@@ -0,0 +1,222 @@
+# -------------------------------------------------
+# Compact binary Gantt traces
+# -------------------------------------------------
+# File layout (little-endian):
+#
+#   header   32 bytes   magic b"GNTT", version u32, segment count u64,
+#                       pid count u32, reserved u32, pid table offset u64
+#   records  16 bytes   pid id u32, start i64, duration i32   (x segment count)
+#   pid table           UTF-8 JSON list of pid labels; record pid ids index it
+#
+# TraceWriter streams segments to disk in fixed-size batches; read_trace()
+# memory-maps the records so very large traces never become Python objects.
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from utils import as_table
+
+
+MAGIC = b"GNTT"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQIIQ")
+HEADER_SIZE = _HEADER.size
+
+RECORD = np.dtype([("pid", "<u4"), ("start", "<i8"), ("duration", "<i4")])
+
+# Records buffered by the writer / processed per pass by the reader
+_BATCH = 1 << 16
+
+
+# -------------------------------------------------
+# Writer
+# -------------------------------------------------
+class TraceWriter:
+    """
+    Write Gantt segments to a trace file as they are produced.
+
+    Pids are interned to integer ids on the fly. Use as a context manager,
+    or call `close()` to write the pid table and finalize the header.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if self.path.parent and not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(b"\0" * HEADER_SIZE)
+        self._ids: Dict[object, int] = {}
+        self._labels = []
+        self._buffer = np.empty(_BATCH, dtype=RECORD)
+        self._used = 0
+        self.count = 0
+
+    def _intern(self, pid) -> int:
+        pid_id = self._ids.get(pid)
+        if pid_id is None:
+            pid_id = self._ids[pid] = len(self._labels)
+            self._labels.append(pid)
+        return pid_id
+
+    def write(self, pid, start: int, duration: int):
+        self._buffer[self._used] = (self._intern(pid), start, duration)
+        self._used += 1
+        if self._used == _BATCH:
+            self._flush()
+
+    def write_many(self, segments: Iterable[Tuple[object, int, int]]):
+        for pid, start, duration in segments:
+            self.write(pid, start, duration)
+
+    def _flush(self):
+        if self._used:
+            self._buffer[:self._used].tofile(self._file)
+            self.count += self._used
+            self._used = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._flush()
+        table_offset = self._file.tell()
+        self._file.write(json.dumps(self._labels).encode("utf-8"))
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.count, len(self._labels), 0, table_offset))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_trace(path, segments: Iterable[Tuple[object, int, int]]) -> str:
+    """Write every segment of `segments` (a gantt list or stream) to `path`."""
+    with TraceWriter(path) as writer:
+        writer.write_many(segments)
+    return str(path)
+
+
+# -------------------------------------------------
+# Reader
+# -------------------------------------------------
+class Trace:
+    """
+    Memory-mapped view of a trace file.
+
+    `pid_id`, `start` and `duration` are read-only NumPy views straight onto
+    the file; `pids` maps ids back to labels. Iterating yields
+    (pid, start, duration) tuples like a gantt list, one batch at a time.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+            if len(raw) < HEADER_SIZE:
+                raise ValueError(f"{path}: not a Gantt trace (file too short)")
+            magic, version, count, n_pids, _, table_offset = _HEADER.unpack(raw)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a Gantt trace (bad magic)")
+            if version != VERSION:
+                raise ValueError(f"{path}: unsupported trace version {version}")
+            f.seek(table_offset)
+            self.pids = json.loads(f.read().decode("utf-8"))
+        if len(self.pids) != n_pids:
+            raise ValueError(f"{path}: corrupt pid table")
+
+        if count:
+            self.records = np.memmap(self.path, dtype=RECORD, mode="r",
+                                     offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=RECORD)
+
+    @property
+    def pid_id(self) -> np.ndarray:
+        return self.records["pid"]
+
+    @property
+    def start(self) -> np.ndarray:
+        return self.records["start"]
+
+    @property
+    def duration(self) -> np.ndarray:
+        return self.records["duration"]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, idx: int) -> Tuple[object, int, int]:
+        rec = self.records[idx]
+        return self.pids[int(rec["pid"])], int(rec["start"]), int(rec["duration"])
+
+    def __iter__(self) -> Iterator[Tuple[object, int, int]]:
+        pids = self.pids
+        for lo in range(0, len(self), _BATCH):
+            chunk = self.records[lo:lo + _BATCH]
+            for pid_id, start, duration in zip(chunk["pid"].tolist(), chunk["start"].tolist(),
+                                               chunk["duration"].tolist()):
+                yield pids[pid_id], start, duration
+
+    def end_time(self) -> int:
+        if not len(self):
+            return 0
+        end = 0
+        for lo in range(0, len(self), _BATCH):
+            chunk = self.records[lo:lo + _BATCH]
+            end = max(end, int((chunk["start"] + chunk["duration"]).max()))
+        return end
+
+    def process_times(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-pid (first start, completion, executed time), indexed by pid id.
+
+        Computed in fixed-size passes over the mapped records, so memory use
+        does not depend on the trace length.
+        """
+        n = len(self.pids)
+        first = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+        last = np.zeros(n, dtype=np.int64)
+        executed = np.zeros(n, dtype=np.int64)
+        for lo in range(0, len(self), _BATCH):
+            chunk = self.records[lo:lo + _BATCH]
+            ids = chunk["pid"]
+            start = chunk["start"]
+            np.minimum.at(first, ids, start)
+            np.maximum.at(last, ids, start + chunk["duration"])
+            np.add.at(executed, ids, chunk["duration"])
+        return first, last, executed
+
+
+def read_trace(path) -> Trace:
+    return Trace(path)
+
+
+def trace_metrics(trace: Trace, processes) -> Dict[str, float]:
+    """
+    Average TAT/WT/RT of a run, from its trace plus the workload's arrivals.
+
+    Equivalent to compute_metrics() on the scheduled processes, but only
+    needs the trace and the input columns.
+    """
+    table = as_table(processes)
+    if not len(trace.pids):
+        return {"avg_tat": 0, "avg_wt": 0, "avg_rt": 0}
+
+    first, completion, _ = trace.process_times()
+    row_of = {pid: idx for idx, pid in enumerate(table.pid.tolist())}
+    rows = np.array([row_of[pid] for pid in trace.pids], dtype=np.int64)
+    arrival = table.arrival[rows].astype(np.int64)
+
+    tat = completion - arrival
+    wt = tat - table.burst[rows]
+    rt = first - arrival
+    return {
+        "avg_tat": float(tat.mean()),
+        "avg_wt": float(wt.mean()),
+        "avg_rt": float(rt.mean()),
+    }
@@ -2,252 +2,39 @@
 # Imports
 # -------------------------------------------------
 import sys
-import random
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List, Dict
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QComboBox, QSpinBox, QTableWidget, QTableWidgetItem,
-    QMessageBox, QFrame, QScrollArea, QSizePolicy, QHeaderView
+    QPushButton, QComboBox, QSpinBox, QMessageBox, QFrame, QScrollArea,
+    QSizePolicy, QFileDialog, QProgressDialog
 )
 from PyQt5.QtCore import Qt
 
 from animation_widget import AnimationWidget
-from datetime import datetime, timedelta
+from loaders import load_workload
+from registry import ALGORITHMS, QUANTUM, Algorithm
+from result_cache import ResultCache
+from simulation_thread import SimulationThread
+from table_model import ProcessTableView, process_columns, result_columns
+from utils import ProcessTable, random_workload
 
-BASE_TIME = datetime.now().replace(microsecond=0)
+MAX_PROCESSES = 1_000_000
 
-
-# -------------------------------------------------
-# Data Model
-# -------------------------------------------------
-@dataclass
-class Process:
-    pid: str
-    arrival: int
-    burst: int
-    priority: int
-    remaining: int = None
-    start_time: int = None
-    completion_time: int = None
-    response_time: int = None
-
-    def __post_init__(self):
-        self.reset_runtime()
-
-    def reset_runtime(self):
-        self.remaining = self.burst
-        self.start_time = None
-        self.completion_time = None
-        self.response_time = None
-
-
-# -------------------------------------------------
-# Helper Functions
-# -------------------------------------------------
-def seconds_to_time(sec):
-    if sec is None:
-        return "--"
-    return (BASE_TIME + timedelta(seconds=int(sec))).strftime("%H:%M:%S")
-
-
-def sync_processes(original: List[Process], updated: List[Process]):
-    for o in original:
-        for u in updated:
-            if o.pid == u.pid:
-                o.start_time = u.start_time
-                o.completion_time = u.completion_time
-                o.response_time = u.response_time
-                o.remaining = u.remaining
-
-
-def compute_metrics(processes: List[Process]) -> Dict[str, float]:
-    n = len(processes)
-    tat = sum(p.completion_time - p.arrival for p in processes)
-    wt = sum((p.completion_time - p.arrival - p.burst) for p in processes)
-    rt = sum(p.response_time or 0 for p in processes)
-
-    return {
-        "avg_tat": tat / n if n else 0,
-        "avg_wt": wt / n if n else 0,
-        "avg_rt": rt / n if n else 0
-    }
+# Largest value a QSpinBox holds, for parameters without a maximum
+SPIN_MAX = 2 ** 31 - 1
 
 
-# -------------------------------------------------
-# Scheduling Algorithms
-# -------------------------------------------------
-def fcfs_scheduler(processes: List[Process]):
-    procs = sorted(deepcopy(processes), key=lambda p: (p.arrival, p.pid))
-    time, gantt = 0, []
-
-    for p in procs:
-        time = max(time, p.arrival)
-        p.start_time = time
-        p.response_time = time - p.arrival
-        gantt.append((p.pid, time, p.burst))
-        time += p.burst
-        p.completion_time = time
-        p.remaining = 0
-
-    sync_processes(processes, procs)
-    return gantt
-
-
-def sjf_nonpreemptive(processes: List[Process]):
-    procs = deepcopy(processes)
-    time, gantt = 0, []
-
-    while any(p.remaining > 0 for p in procs):
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
-        if not ready:
-            time += 1
-            continue
-
-        p = min(ready, key=lambda x: x.burst)
-        p.start_time = time
-        p.response_time = time - p.arrival
-        gantt.append((p.pid, time, p.burst))
-        time += p.burst
-        p.remaining = 0
-        p.completion_time = time
-
-    sync_processes(processes, procs)
-    return gantt
-
-
-def sjf_preemptive(processes: List[Process]):
-    procs = deepcopy(processes)
-    time, gantt = 0, []
-
-    while any(p.remaining > 0 for p in procs):
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
-        if not ready:
-            time += 1
-            continue
-
-        p = min(ready, key=lambda x: x.remaining)
-        if p.start_time is None:
-            p.start_time = time
-            p.response_time = time - p.arrival
-
-        if gantt and gantt[-1][0] == p.pid:
-            pid, s, d = gantt.pop()
-            gantt.append((pid, s, d + 1))
-        else:
-            gantt.append((p.pid, time, 1))
-
-        p.remaining -= 1
-        time += 1
-        if p.remaining == 0:
-            p.completion_time = time
-
-    sync_processes(processes, procs)
-    return gantt
-
-
-def priority_nonpreemptive(processes: List[Process]):
-    procs = deepcopy(processes)
-    time, gantt = 0, []
-
-    while any(p.remaining > 0 for p in procs):
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
-        if not ready:
-            time += 1
-            continue
-
-        p = min(ready, key=lambda x: x.priority)
-        p.start_time = time
-        p.response_time = time - p.arrival
-        gantt.append((p.pid, time, p.burst))
-        time += p.burst
-        p.remaining = 0
-        p.completion_time = time
-
-    sync_processes(processes, procs)
-    return gantt
-
-
-def priority_preemptive(processes: List[Process]):
-    procs = deepcopy(processes)
-    time, gantt = 0, []
-
-    while any(p.remaining > 0 for p in procs):
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
-        if not ready:
-            time += 1
-            continue
-
-        p = min(ready, key=lambda x: x.priority)
-        if p.start_time is None:
-            p.start_time = time
-            p.response_time = time - p.arrival
-
-        if gantt and gantt[-1][0] == p.pid:
-            pid, s, d = gantt.pop()
-            gantt.append((pid, s, d + 1))
-        else:
-            gantt.append((p.pid, time, 1))
-
-        p.remaining -= 1
-        time += 1
-        if p.remaining == 0:
-            p.completion_time = time
-
-    sync_processes(processes, procs)
-    return gantt
-
-
-def round_robin(processes: List[Process], quantum: int):
-    procs = deepcopy(processes)
-    procs.sort(key=lambda p: p.arrival)
-    time, gantt, queue = 0, [], []
-    i = 0
-
-    while queue or i < len(procs):
-        while i < len(procs) and procs[i].arrival <= time:
-            queue.append(procs[i])
-            i += 1
-
-        if not queue:
-            time = procs[i].arrival
-            continue
-
-        p = queue.pop(0)
-        if p.start_time is None:
-            p.start_time = time
-            p.response_time = time - p.arrival
-
-        run = min(quantum, p.remaining)
-        gantt.append((p.pid, time, run))
-        time += run
-        p.remaining -= run
-
-        while i < len(procs) and procs[i].arrival <= time:
-            queue.append(procs[i])
-            i += 1
-
-        if p.remaining > 0:
-            queue.append(p)
-        else:
-            p.completion_time = time
-
-    sync_processes(processes, procs)
-    return gantt
-
 # -------------------------------------------------
 # Simulation Window
 # -------------------------------------------------
 
 class SimulationWindow(QMainWindow):
-    def __init__(self, processes, gantt, algo_name, preserve_state=True):
+    def __init__(self, processes, gantt, algorithm: Algorithm, preserve_state=True):
         super().__init__()
         self.setWindowTitle("CPU Scheduler Simulator - Animation & Results")
         self.showMaximized() 
         self.processes = processes
-        self.algo_name = algo_name
+        self.algorithm = algorithm
         self.preserve_state = preserve_state
 
         # Scrollable root widget
@@ -265,10 +52,8 @@ class SimulationWindow(QMainWindow):
         layout.addWidget(self.animation)
 
         # Result table (initially hidden)
-        
-        self.result_table = QTableWidget()
+        self.result_table = ProcessTableView()
         self.result_table.setVisible(False)
-        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.result_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         layout.addWidget(self.result_table)
 
@@ -279,68 +64,14 @@ class SimulationWindow(QMainWindow):
         self.animation.play(gantt, processes, time_unit_ms=350, preserve_state=self.preserve_state)
 
     def show_results(self):
-        processes = self.processes
-
-        show_priority = "Priority" in self.algo_name
-        
-        # 🔹 Headers
-        if show_priority:
-            headers = [
-                "PID", "Arrival", "Burst", "Priority",
-                "Start", "Completion", "TAT", "WT", "Response"
-            ]
-        else:
-            headers = [
-                "PID", "Arrival", "Burst",
-                "Start", "Completion", "TAT", "WT", "Response"
-            ]
-
-        self.result_table.clear()
-        self.result_table.setColumnCount(len(headers))
-        self.result_table.setHorizontalHeaderLabels(headers)
-        self.result_table.setRowCount(0)
-
-        # Fill table
-        for p in processes:
-            tat = p.completion_time - p.arrival
-            wt = tat - p.burst
-            row = [
-                p.pid,
-                seconds_to_time(p.arrival),
-                p.burst
-            ]
-
-            # Priority column handling
-            if show_priority:
-                row.append(p.priority)   
-
-            row += [
-                seconds_to_time(p.start_time),
-                seconds_to_time(p.completion_time),
-                tat,
-                wt,
-                seconds_to_time(p.response_time)
-            ]
-
-            r = self.result_table.rowCount()
-            self.result_table.insertRow(r)
-
-            for c, v in enumerate(row):
-                self.result_table.setItem(
-                    r, c, QTableWidgetItem(str(v))
-                )
-
-        # 🔹 IMPORTANT PART STARTS HERE 🔹
-
-        row_h = self.result_table.verticalHeader().defaultSectionSize()
-        header_h = self.result_table.horizontalHeader().height()
-
-        total_h = header_h + row_h * len(processes) + 10
-
-        self.result_table.setMinimumHeight(total_h)
-        self.result_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.result_table.set_data(self.processes, result_columns(self.algorithm.uses_priority))
 
-        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # 🔹 Fit short tables, scroll long ones inside the view
+        view = self.result_table.view
+        row_h = view.verticalHeader().defaultSectionSize()
+        header_h = view.horizontalHeader().height()
+        rows = min(len(self.processes), 20)
+        self.result_table.setMinimumHeight(header_h + row_h * rows + 50)
 
         self.result_table.setVisible(True)
 
@@ -353,7 +84,9 @@ class SchedulerApp(QMainWindow):
         self.setWindowTitle("CPU Scheduler Simulator")
         self.showMaximized() 
         self.setStyleSheet("background-color:#f5f5f5;")
-        self.processes: List[Process] = []
+        self.processes = ProcessTable([], [], [])
+        self.worker = None
+        self.cache = ResultCache()      # re-running the same table is instant
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -378,10 +111,8 @@ class SchedulerApp(QMainWindow):
         algo_layout = QVBoxLayout(algo_card)
         algo_layout.addWidget(QLabel("Select Algorithm"))
         self.algo_box = QComboBox()
-        self.algo_box.addItems([
-            'FCFS','SJF (Non-Preemptive)','SJF (Preemptive)',
-            'Priority (Non-Preemptive)','Priority (Preemptive)','Round Robin'
-        ])
+        for algorithm in ALGORITHMS.values():
+            self.algo_box.addItem(algorithm.name, algorithm.id)
         self.algo_box.setStyleSheet("font-size:13px;")
         algo_layout.addWidget(self.algo_box)
         algo_card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -392,7 +123,7 @@ class SchedulerApp(QMainWindow):
         num_layout = QVBoxLayout(num_card)
         num_layout.addWidget(QLabel("Select Number of Processes"))
         self.num_spin = QSpinBox()
-        self.num_spin.setRange(1, 200)
+        self.num_spin.setRange(1, MAX_PROCESSES)
         self.num_spin.setValue(5)
         self.num_spin.setStyleSheet("font-size:13px;")
         num_layout.addWidget(self.num_spin)
@@ -405,10 +136,11 @@ class SchedulerApp(QMainWindow):
         self.quantum_card.setStyleSheet("QFrame {background:white; border-radius:8px; padding:8px; font-size:15px;}")
         ql = QHBoxLayout(self.quantum_card)
         ql.setSpacing(10)
-        ql.addWidget(QLabel("Quantum (Round Robin)"))
+        ql.addWidget(QLabel(QUANTUM.label))
         self.quantum_spin = QSpinBox()
-        self.quantum_spin.setRange(1, 20)
-        self.quantum_spin.setValue(2)
+        self.quantum_spin.setRange(QUANTUM.minimum,
+                                   QUANTUM.maximum if QUANTUM.maximum is not None else SPIN_MAX)
+        self.quantum_spin.setValue(QUANTUM.default)
         self.quantum_spin.setStyleSheet("font-size:13px;")
         self.quantum_spin.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         ql.addWidget(self.quantum_spin)
@@ -416,18 +148,22 @@ class SchedulerApp(QMainWindow):
         self.main_layout.addWidget(self.quantum_card)
 
         self.algo_box.currentIndexChanged.connect(
-            lambda: self.quantum_card.setVisible('Round Robin' in self.algo_box.currentText())
+            lambda: self.quantum_card.setVisible(bool(self.current_algorithm().params))
         )
 
         btn_row = QHBoxLayout()
         gen = QPushButton("Generate Table")
         gen.setStyleSheet("background-color:#0D3B66;color:white;padding:8px 12px;border-radius:5px;")
         gen.clicked.connect(self.generate_table)
-        run = QPushButton("Run Simulation")
-        run.setStyleSheet("background-color:#119DA4;color:white;padding:8px 12px;border-radius:5px;")
-        run.clicked.connect(self.run_simulation)
+        self.run_btn = QPushButton("Run Simulation")
+        self.run_btn.setStyleSheet("background-color:#119DA4;color:white;padding:8px 12px;border-radius:5px;")
+        self.run_btn.clicked.connect(self.run_simulation)
+        load = QPushButton("Load Workload")
+        load.setStyleSheet("background-color:#0D3B66;color:white;padding:8px 12px;border-radius:5px;")
+        load.clicked.connect(self.load_workload_file)
         btn_row.addWidget(gen)
-        btn_row.addWidget(run)
+        btn_row.addWidget(load)
+        btn_row.addWidget(self.run_btn)
         self.main_layout.addLayout(btn_row)
 
 
@@ -440,71 +176,96 @@ class SchedulerApp(QMainWindow):
         )
         self.main_layout.addWidget(self.table_placeholder)
 
-        self.proc_table = QTableWidget()
+        self.proc_table = ProcessTableView()
         self.proc_table.setVisible(False)
-
-       
-
-        # self.proc_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.proc_table.setMinimumHeight(300)
         self.proc_table.setSizePolicy(
             QSizePolicy.Expanding,
             QSizePolicy.Expanding
         )
-        # self.main_layout.replaceWidget(self.table_placeholder, self.proc_table)
-        # self.table_placeholder.hide()
-        # self.main_layout.addWidget(self.proc_table)
-        self.proc_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.main_layout.addWidget(self.proc_table)
 
 
     def generate_table(self):
-        algo = self.algo_box.currentText()
+        self.processes = random_workload(self.num_spin.value())
+        self.show_process_table()
 
+    def load_workload_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Workload", "",
+            "Workloads (*.csv *.jsonl *.ndjson *.bin);;All files (*)"
+        )
+        if not path:
+            return
+        try:
+            self.processes = load_workload(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Load Workload", f"Could not load workload:\n{e}")
+            return
+        self.show_process_table()
+
+    def current_algorithm(self) -> Algorithm:
+        return ALGORITHMS[self.algo_box.currentData()]
+
+    def show_process_table(self):
         # decide columns based on algorithm
-        if 'Priority' in algo:
-            headers = ['PID','Arrival','Burst','Priority']
-        else:
-            headers = ['PID','Arrival','Burst']
-
-        self.proc_table.clear()
-        self.proc_table.setColumnCount(len(headers))
-        self.proc_table.setHorizontalHeaderLabels(headers)
-        self.proc_table.setRowCount(self.num_spin.value())
-
-        self.processes.clear()
-        for i in range(self.num_spin.value()):
-            p = Process(f"P{i+1}", random.randint(0,30), random.randint(1,10), random.randint(1,10))
-            self.processes.append(p)
-            values = [p.pid, seconds_to_time(p.arrival), p.burst]
-            if 'Priority' in headers:
-                values.append(p.priority)
-            for c, v in enumerate(values):
-                self.proc_table.setItem(i, c, QTableWidgetItem(str(v)))
-
-            self.proc_table.resizeRowsToContents()
+        columns = process_columns(self.current_algorithm().uses_priority)
+        self.proc_table.set_data(self.processes, columns)
+
         self.proc_table.setVisible(True)        # show table
-        self.table_placeholder.setVisible(False)     
+        self.table_placeholder.setVisible(False)
+
     def run_simulation(self):
-        for p in self.processes:
-            p.reset_runtime()
-
-        algo = self.algo_box.currentText()
-        if algo == 'FCFS':
-            gantt = fcfs_scheduler(self.processes)
-        elif algo == 'SJF (Non-Preemptive)':
-            gantt = sjf_nonpreemptive(self.processes)
-        elif algo == 'SJF (Preemptive)':
-            gantt = sjf_preemptive(self.processes)
-        elif algo == 'Priority (Non-Preemptive)':
-            gantt = priority_nonpreemptive(self.processes)
-        elif algo == 'Priority (Preemptive)':
-            gantt = priority_preemptive(self.processes)
-        else:
-            gantt = round_robin(self.processes, self.quantum_spin.value())
-
-        self.sim = SimulationWindow(self.processes, gantt, self.algo_box.currentText())
+        if self.worker is not None:
+            return
+
+        # 🔹 Schedule on a worker thread; the window opens with the full gantt.
+        # Each run writes its results to its own table, so windows still
+        # open from earlier runs keep showing theirs
+        algo = self.current_algorithm()
+        params = {QUANTUM.name: self.quantum_spin.value()} if algo.params else {}
+        run_table = self.processes.fresh_copy()
+        self.worker = SimulationThread(algo, run_table, params, self.cache, self)
+
+        self.progress_dialog = QProgressDialog(f"Running {algo.name}...", "Cancel", 0, 1000, self)
+        self.progress_dialog.setWindowTitle("Run Simulation")
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(300)
+        self.progress_dialog.setValue(0)
+        self.progress_dialog.canceled.connect(self.worker.cancel)
+
+        self.worker.progress.connect(self.show_progress)
+        self.worker.completed.connect(self.show_simulation)
+        self.worker.failed.connect(self.simulation_failed)
+        self.worker.finished.connect(self.simulation_done)
+        self.run_btn.setEnabled(False)
+        self.worker.start()
+
+    def show_progress(self, sim_time, end_time):
+        if not self.progress_dialog.wasCanceled():
+            self.progress_dialog.setValue(int(1000 * sim_time / end_time) if end_time else 1000)
+            self.progress_dialog.setLabelText(f"Running {self.worker.algorithm.name}... "
+                                       f"t = {sim_time:,.0f} / {end_time:,.0f}")
+
+    def show_simulation(self, gantt):
+        self.sim = SimulationWindow(self.worker.processes, gantt, self.worker.algorithm)
         self.sim.show()
 
+    def simulation_failed(self, message):
+        QMessageBox.warning(self, "Run Simulation", f"Simulation failed:\n{message}")
+
+    def simulation_done(self):
+        self.progress_dialog.reset()
+        self.run_btn.setEnabled(True)
+        self.worker.deleteLater()
+        self.worker = None
+
+    def closeEvent(self, event):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+        super().closeEvent(event)
+
 # -------------------------------------------------
 # Run Application
 # -------------------------------------------------
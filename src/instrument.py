@@ -0,0 +1,140 @@
+# -------------------------------------------------
+# Scheduler instrumentation
+# -------------------------------------------------
+# Pass an Instrumentation to any scheduler (`instrument=`) to get event
+# counters and per-phase wall times for the run. The engines keep their
+# counters in local variables and hand them over once at the end, so a run
+# without instrumentation pays nothing beyond a few integer increments.
+#
+#   python src/instrument.py --algorithm sjf_p --processes 200000
+#   python src/instrument.py --algorithm rr --quantum 4 --profile rr.prof
+import argparse
+import cProfile
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+COUNTERS = (
+    "dispatches",          # times a process was picked to run
+    "ready_inserts",       # pushes onto the ready queue (admissions + requeues)
+    "ready_extracts",      # pops from the ready queue
+    "context_switches",    # a segment for a different process than the last one
+    "idle_jumps",          # clock jumps over an idle CPU to the next arrival
+    "gantt_merges",        # slices folded into the previous gantt segment
+    "segments",            # gantt segments produced
+)
+
+# setup: input conversion, result buffers and engine preparation (sorting,
+#        column copies); loop: the scheduling loop, including any time the
+#        consumer of a *_stream spends between segments; sync: writing the
+#        results back onto the caller's processes
+PHASES = ("setup", "loop", "sync")
+
+
+class Instrumentation:
+    """
+    Counters and phase timers for one or more scheduling runs.
+
+    Values accumulate across runs, so one instance can be passed to several
+    calls to get totals.
+    """
+    __slots__ = ("counters", "timings", "runs", "_mark")
+
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.runs = 0
+        self._mark = 0.0
+
+    def start(self):
+        """Start timing a run; the first phase begins now."""
+        self.runs += 1
+        self._mark = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Charge the time since the previous mark to `phase`."""
+        now = time.perf_counter()
+        self.timings[phase] += now - self._mark
+        self._mark = now
+
+    def count(self, **counts: int):
+        for name, value in counts.items():
+            self.counters[name] += value
+
+    def report(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "counters": dict(self.counters),
+            "timings": dict(self.timings),
+            "total_time": sum(self.timings.values()),
+        }
+
+    def format(self) -> str:
+        total = sum(self.timings.values()) or 1.0
+        lines = [f"runs: {self.runs}"]
+        lines += [f"  {name:<17} {value:>12,}" for name, value in self.counters.items()]
+        lines += [f"  {name:<17} {seconds * 1000:>10.2f} ms  {seconds / total:6.1%}"
+                  for name, seconds in self.timings.items()]
+        return "\n".join(lines)
+
+
+@contextmanager
+def profiled(path: str):
+    """Run the body under cProfile and dump the stats to `path`."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    from loaders import load_workload
+    from registry import ALGORITHMS
+    from utils import random_workload
+
+    parser = argparse.ArgumentParser(description="Instrumented run of one scheduling algorithm")
+    parser.add_argument("--algorithm", default="sjf_p", choices=list(ALGORITHMS))
+    parser.add_argument("--quantum", type=int, default=2, help="Round Robin quantum")
+    parser.add_argument("--workload", help="CSV/JSONL/binary workload file")
+    parser.add_argument("--processes", type=int, default=100_000, help="random workload size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--profile", metavar="PATH",
+                        help="also write cProfile stats here (view with snakeviz, or turn "
+                             "into a flamegraph with flameprof / gprof2dot)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.workload:
+        table = load_workload(args.workload)
+    else:
+        table = random_workload(args.processes, args.seed)
+    algo = ALGORITHMS[args.algorithm]
+    params = {"quantum": args.quantum} if algo.params else {}
+    probe = Instrumentation()
+
+    def run():
+        for _ in range(args.repeat):
+            table.reset()
+            algo.run(table, instrument=probe, **params)
+
+    if args.profile:
+        with profiled(args.profile):
+            run()
+    else:
+        run()
+
+    print(json.dumps(probe.report(), indent=2) if args.json else probe.format())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
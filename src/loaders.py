@@ -0,0 +1,301 @@
+# -------------------------------------------------
+# Workload loaders
+# -------------------------------------------------
+# Read recorded job traces straight into a ProcessTable, chunk by chunk.
+#
+#   CSV    header row naming the columns; `arrival` and `burst` are required,
+#          `pid` and `priority` optional (pids default to 1..n, priority to 1)
+#   JSONL  one object per line with the same keys; the first object decides
+#          which optional columns are present, as a CSV header would
+#   binary headerless little-endian records of WORKLOAD_RECORD; loaded by
+#          memory-mapping the file, so nothing is read up front
+import json
+import warnings
+from itertools import islice, repeat
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from utils import ProcessTable
+
+
+COLUMNS = ("pid", "arrival", "burst", "priority")
+REQUIRED = ("arrival", "burst")
+
+# Record layout of the raw binary workload format (24 bytes per process)
+WORKLOAD_RECORD = np.dtype([("pid", "<i8"), ("arrival", "<i8"),
+                            ("burst", "<i4"), ("priority", "<i4")])
+
+CHUNK_ROWS = 1 << 20
+
+# Widest pid label the text loaders accept
+_PID_WIDTH = 64
+
+
+def _check_columns(names, path):
+    missing = [c for c in REQUIRED if c not in names]
+    if missing:
+        raise ValueError(f"{path}: missing required column(s): {', '.join(missing)}")
+
+
+def _check_bursts(path, burst: np.ndarray, where: Callable[[int], str]):
+    """Reject bursts below 1; `where(i)` names row i of `burst` in the file."""
+    if len(burst) and burst.min() < 1:
+        i = int(np.argmax(burst < 1))
+        raise ValueError(f"{path}: {where(i)}: 'burst' must be at least 1, got {burst[i]}")
+
+
+def _normalize_pids(pid: np.ndarray) -> np.ndarray:
+    """
+    Integer pids as int64, whichever loader read them.
+
+    Text pids that are all plain integers ("7", not "007" or "P7") become
+    int64, so a workload loads the same from CSV or JSONL and can be saved
+    in the binary format. Other labels keep a string dtype just wide
+    enough for the longest one.
+    """
+    if pid.dtype.kind != "U" or not len(pid):
+        return pid
+    try:
+        ints = pid.astype(np.int64)
+    except (ValueError, OverflowError):
+        ints = None
+    if ints is not None and np.array_equal(ints.astype(pid.dtype), pid):
+        return ints
+    width = max(1, int(np.char.str_len(pid).max()))
+    return pid.astype(f"U{width}")
+
+
+def _build_table(path, chunks: Dict[str, List[np.ndarray]], n: int) -> ProcessTable:
+    """Concatenate per-column chunks into a ProcessTable."""
+    def column(name):
+        if name not in chunks:
+            return None
+        parts = chunks[name]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    pid = column("pid")
+    if pid is None:
+        pid = np.arange(1, n + 1, dtype=np.int64)
+    else:
+        pid = _normalize_pids(pid)
+    try:
+        return ProcessTable(pid, column("arrival"), column("burst"), column("priority"))
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+
+
+# -------------------------------------------------
+# CSV
+# -------------------------------------------------
+def load_csv(path, chunk_rows: int = CHUNK_ROWS, delimiter: str = ",") -> ProcessTable:
+    """
+    Load a CSV workload, parsing `chunk_rows` rows per pass with NumPy's C reader.
+
+    Rows go straight into typed column arrays; no per-row Python objects.
+    Empty or non-integer values, and bursts below 1, raise ValueError.
+    """
+    with open(path, newline="") as f:
+        names = [name.strip() for name in f.readline().split(delimiter)]
+        _check_columns(names, path)
+        usecols = [names.index(c) for c in COLUMNS if c in names]
+        dtype = np.dtype([(names[i], f"U{_PID_WIDTH}" if names[i] == "pid" else "i8")
+                          for i in usecols])
+
+        chunks: Dict[str, List[np.ndarray]] = {name: [] for name in dtype.names}
+        n = 0
+        with warnings.catch_warnings():
+            # loadtxt warns when the final pass finds no rows left
+            warnings.simplefilter("ignore", UserWarning)
+            while True:
+                try:
+                    block = np.loadtxt(f, delimiter=delimiter, dtype=dtype, usecols=usecols,
+                                       max_rows=chunk_rows, ndmin=1)
+                except ValueError as e:
+                    # loadtxt counts rows from the start of the chunk
+                    offset = f" (rows counted from data row {n})" if n else ""
+                    raise ValueError(f"{path}: {e}{offset}") from None
+                if not len(block):
+                    break
+                _check_bursts(path, block["burst"],
+                              lambda i: f"line {_csv_line(path, n + i)}")
+                for name in dtype.names:
+                    chunks[name].append(np.ascontiguousarray(block[name]))
+                n += len(block)
+
+    return _build_table(path, chunks, n)
+
+
+def _csv_line(path, row: int) -> int:
+    """File line number of data row `row`, skipping blank and comment lines as loadtxt does."""
+    with open(path, newline="") as f:
+        next(f)     # header
+        seen = -1
+        for lineno, line in enumerate(f, 2):
+            if line.split("#", 1)[0].strip():
+                seen += 1
+                if seen == row:
+                    return lineno
+    return row + 2
+
+
+# -------------------------------------------------
+# JSONL
+# -------------------------------------------------
+_KINDS = {frozenset({int}): "an integer", frozenset({str}): "a string",
+          frozenset({int, str}): "an integer or a string"}
+
+
+def _jsonl_column(path, rows, numbers, name, allowed=frozenset({int})) -> np.ndarray:
+    """
+    One column of a decoded chunk, rejecting the rows load_csv would reject.
+
+    Every row must have the column and its value must be of one of the
+    `allowed` types. null, floats and booleans are errors rather than
+    being coerced.
+    """
+    values = list(map(dict.get, rows, repeat(name)))
+    # Type check in bulk; the per-row scan only runs to report an error
+    bad = set(map(type, values)) - allowed
+    for value, row, lineno in zip(values, rows, numbers) if bad else ():
+        if type(value) in bad:
+            if name not in row:
+                raise ValueError(f"{path}: line {lineno}: missing '{name}'")
+            like = " like the first row's" if name == "pid" and len(allowed) == 1 else ""
+            raise ValueError(f"{path}: line {lineno}: '{name}' must be {_KINDS[allowed]}"
+                             f"{like}, got {json.dumps(value)}")
+
+    if allowed == {str}:
+        return np.array(values, dtype=f"U{_PID_WIDTH}")
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        info = np.iinfo(np.int64)
+        lineno = next(k for v, k in zip(values, numbers)
+                      if isinstance(v, int) and not info.min <= v <= info.max)
+        raise ValueError(f"{path}: line {lineno}: '{name}' does not fit in int64") from None
+
+
+def _decode_chunk(path, lines, numbers) -> List[dict]:
+    try:
+        rows = json.loads("[" + ",".join(lines) + "]")
+    except json.JSONDecodeError:
+        # Decode line by line to report where the bad one is
+        rows = []
+        for line, lineno in zip(lines, numbers):
+            try:
+                rows.append(json.loads(line.rstrip()))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}: line {lineno}: {e.msg} (column {e.colno})") from None
+    if set(map(type, rows)) != {dict}:
+        lineno = next(k for row, k in zip(rows, numbers) if not isinstance(row, dict))
+        raise ValueError(f"{path}: line {lineno}: expected a JSON object")
+    return rows
+
+
+def load_jsonl(path, chunk_rows: int = CHUNK_ROWS) -> ProcessTable:
+    """
+    Load a JSON-lines workload in chunks of `chunk_rows` lines.
+
+    Each chunk is decoded and turned into column arrays; the decoded
+    objects of one chunk are dropped before the next is read, so memory
+    stays proportional to the columns rather than to the row objects.
+
+    The first row fixes the columns, like a CSV header: every later row
+    must have the same ones, with the same value rules as load_csv. Pids
+    are all integers or all strings, as on the first row. Anything else
+    raises ValueError naming the line.
+    """
+    chunks: Dict[str, List[np.ndarray]] = {}
+    names = None
+    pid_types = frozenset({int, str})
+    n = 0
+    lineno = 0
+
+    with open(path) as f:
+        while True:
+            block = list(islice(f, chunk_rows))
+            if not block:
+                break
+            numbers = range(lineno + 1, lineno + len(block) + 1)
+            lines = block
+            if not all(map(str.strip, block)):
+                numbers = [k for k, line in zip(numbers, block) if line.strip()]
+                lines = [line for line in block if line.strip()]
+            lineno += len(block)
+            if not lines:
+                continue
+
+            rows = _decode_chunk(path, lines, numbers)
+            if names is None:
+                names = [c for c in COLUMNS if c in rows[0]]
+                _check_columns(names, path)
+                chunks = {name: [] for name in names}
+                if type(rows[0].get("pid")) in pid_types:
+                    pid_types = frozenset({type(rows[0]["pid"])})
+            for extra in (c for c in COLUMNS if c not in names):
+                for row, k in zip(rows, numbers):
+                    if extra in row:
+                        raise ValueError(f"{path}: line {k}: '{extra}' is not in the first row")
+
+            for name in names:
+                allowed = pid_types if name == "pid" else frozenset({int})
+                chunks[name].append(_jsonl_column(path, rows, numbers, name, allowed))
+            _check_bursts(path, chunks["burst"][-1], lambda i: f"line {numbers[i]}")
+            n += len(rows)
+            del rows, lines, block
+
+    if names is None:
+        return ProcessTable([], [], [])
+    return _build_table(path, chunks, n)
+
+
+# -------------------------------------------------
+# Raw binary
+# -------------------------------------------------
+def load_binary(path) -> ProcessTable:
+    """
+    Memory-map a raw WORKLOAD_RECORD file; input columns are read-only views.
+
+    Only the burst column is read up front, to reject bursts below 1.
+    """
+    size = Path(path).stat().st_size
+    if size % WORKLOAD_RECORD.itemsize:
+        raise ValueError(f"{path}: size is not a multiple of {WORKLOAD_RECORD.itemsize}-byte records")
+    if not size:
+        return ProcessTable([], [], [])
+
+    records = np.memmap(path, dtype=WORKLOAD_RECORD, mode="r")
+    _check_bursts(path, records["burst"], lambda i: f"record {i + 1}")
+    return ProcessTable(records["pid"], records["arrival"], records["burst"], records["priority"])
+
+
+def save_binary(processes: ProcessTable, path):
+    """Write a ProcessTable with integer pids in the raw binary layout."""
+    if processes.pid.dtype.kind not in "iu":
+        raise ValueError("The binary workload format needs integer pids")
+    records = np.empty(len(processes), dtype=WORKLOAD_RECORD)
+    for name in WORKLOAD_RECORD.names:
+        records[name] = getattr(processes, name)
+    records.tofile(path)
+
+
+# -------------------------------------------------
+# Dispatch by extension
+# -------------------------------------------------
+LOADERS = {
+    ".csv": load_csv,
+    ".jsonl": load_jsonl,
+    ".ndjson": load_jsonl,
+    ".bin": load_binary,
+}
+
+
+def load_workload(path) -> ProcessTable:
+    """Load a workload file, picking the loader from its extension."""
+    loader = LOADERS.get(Path(path).suffix.lower())
+    if loader is None:
+        raise ValueError(f"{path}: unsupported workload format "
+                         f"(expected one of {', '.join(sorted(LOADERS))})")
+    return loader(path)
@@ -0,0 +1,189 @@
+# -------------------------------------------------
+# Streaming scheduling metrics
+# -------------------------------------------------
+# MetricsAccumulator is updated by the engines as each process completes and
+# keeps running mean/variance/max plus approximate p50/p95/p99 for TAT, WT
+# and RT in bounded memory, so tail latency can be reported without holding
+# every finished process.
+import math
+from typing import Dict
+
+import numpy as np
+
+
+QUANTILES = (0.50, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch-style).
+
+    Every positive value lands in bucket ceil(log_gamma(v)), which bounds the
+    relative error of any quantile by `alpha`. The bucket count only grows
+    with log(max / min), never with the number of values, and two sketches
+    merge by adding their counts.
+    """
+    __slots__ = ("alpha", "gamma", "_log_gamma", "zero", "buckets", "count")
+
+    def __init__(self, alpha: float = 0.01):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.zero = 0            # values <= 0
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zero += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def add_many(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
+        self.count += len(values)
+        self.zero += len(values) - len(positive)
+        if not len(positive):
+            return
+        keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+                                 return_counts=True)
+        buckets = self.buckets
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            buckets[key] = buckets.get(key, 0) + count
+
+    def merge(self, other: "QuantileSketch"):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.count += other.count
+        self.zero += other.zero
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint (in relative terms) of (gamma^(k-1), gamma^k]
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class RunningStats:
+    """Welford mean/variance, min/max and a quantile sketch for one metric."""
+    __slots__ = ("count", "mean", "_m2", "min", "max", "sketch")
+
+    def __init__(self, alpha: float = 0.01):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(alpha)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    def add_many(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        # Chan et al. pairwise update: combine with the batch's own mean/M2
+        n, batch_mean = len(values), float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += batch_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.add_many(values)
+
+    def merge(self, other: "RunningStats"):
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class MetricsAccumulator:
+    """
+    Incremental TAT / WT / RT statistics for one scheduling run.
+
+    Pass one to a scheduler (`metrics=`) or a SchedulerSession; `summary()`
+    returns the same avg_* keys as compute_metrics() plus std, max and
+    p50/p95/p99 for each metric.
+    """
+    __slots__ = ("tat", "wt", "rt")
+
+    def __init__(self, alpha: float = 0.01):
+        self.tat = RunningStats(alpha)
+        self.wt = RunningStats(alpha)
+        self.rt = RunningStats(alpha)
+
+    @property
+    def count(self) -> int:
+        return self.tat.count
+
+    def add(self, arrival, burst, start, completion):
+        """Record one completed process."""
+        tat = completion - arrival
+        self.tat.add(tat)
+        self.wt.add(tat - burst)
+        self.rt.add(start - arrival)
+
+    def add_many(self, arrival, burst, start, completion):
+        """Record many completed processes given as arrays."""
+        tat = np.asarray(completion, dtype=np.int64) - arrival
+        self.tat.add_many(tat)
+        self.wt.add_many(tat - burst)
+        self.rt.add_many(np.asarray(start, dtype=np.int64) - arrival)
+
+    def merge(self, other: "MetricsAccumulator"):
+        self.tat.merge(other.tat)
+        self.wt.merge(other.wt)
+        self.rt.merge(other.rt)
+
+    def summary(self) -> Dict[str, float]:
+        out = {}
+        for name in ("tat", "wt", "rt"):
+            stats = getattr(self, name)
+            out[f"avg_{name}"] = stats.mean if stats.count else 0
+        for name in ("tat", "wt", "rt"):
+            stats = getattr(self, name)
+            out[f"std_{name}"] = stats.std
+            out[f"max_{name}"] = stats.max if stats.count else 0
+            for q in QUANTILES:
+                out[f"p{round(q * 100)}_{name}"] = stats.sketch.quantile(q)
+        return out
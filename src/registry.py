@@ -0,0 +1,135 @@
+# -------------------------------------------------
+# Algorithm registry
+# -------------------------------------------------
+# Single lookup table from algorithm id to the scheduling core in
+# schedulers.py, with the display name and the extra parameters each
+# algorithm takes. The GUI, the CLIs and the batch runners all dispatch
+# through it, so they share one implementation and one tie-breaking rule.
+#
+#   algo = ALGORITHMS["rr"]
+#   gantt = algo.run(processes, quantum=4)
+#   gantt = algo.run(processes, quantum=4, cache=cache)   # see result_cache.py
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from instrument import Instrumentation
+from metrics import MetricsAccumulator
+from result_cache import ResultCache, cache_key, cached_stream
+from schedulers import (
+    Segment, FCFS_KEY, SJF_NP_KEY, SJF_P_KEY, PRIORITY_KEY,
+    fcfs, fcfs_stream,
+    sjf_non_preemptive, sjf_non_preemptive_stream,
+    sjf_preemptive, sjf_preemptive_stream,
+    priority_non_preemptive, priority_non_preemptive_stream,
+    priority_preemptive, priority_preemptive_stream,
+    round_robin, round_robin_stream,
+)
+
+
+@dataclass(frozen=True)
+class Param:
+    """An integer parameter an algorithm takes besides the processes."""
+    name: str
+    label: str
+    default: int
+    minimum: int = 1
+    maximum: Optional[int] = None
+
+    def check(self, value) -> int:
+        try:
+            value = operator.index(value)
+        except TypeError:
+            raise TypeError(f"{self.name} must be an integer, got {value!r}") from None
+        if value < self.minimum or (self.maximum is not None and value > self.maximum):
+            upper = f"..{self.maximum}" if self.maximum is not None else " or more"
+            raise ValueError(f"{self.name} must be {self.minimum}{upper}, got {value}")
+        return value
+
+
+@dataclass(frozen=True)
+class Algorithm:
+    """
+    One registered scheduling algorithm.
+
+    `func` returns the whole gantt list and `stream_func` yields it lazily;
+    both take the processes, then `params` positionally, then the optional
+    `metrics=` / `instrument=` keywords. `run()` and `stream()` take the
+    params by name and can go through a ResultCache (`cache=`). `key` is
+    the ready-queue order (schedulers.py *_KEY) of the priority-queue
+    policies; it is None for Round Robin, whose queue is FIFO.
+    """
+    id: str
+    name: str
+    func: Callable
+    stream_func: Callable
+    params: Tuple[Param, ...] = ()
+    preemptive: bool = False
+    uses_priority: bool = False
+    key: Optional[Tuple[str, ...]] = None
+
+    def bind(self, **params) -> tuple:
+        """Validate keyword parameters and return them in positional order."""
+        unknown = set(params) - {p.name for p in self.params}
+        if unknown:
+            raise TypeError(f"{self.id} does not take: {', '.join(sorted(unknown))}")
+        return tuple(p.check(params.get(p.name, p.default)) for p in self.params)
+
+    def run(self, processes, metrics: Optional[MetricsAccumulator] = None,
+            instrument: Optional[Instrumentation] = None,
+            cache: Optional[ResultCache] = None, **params) -> List[Segment]:
+        if cache is not None and instrument is None:
+            return list(self.stream(processes, metrics, cache=cache, **params))
+        return self.func(processes, *self.bind(**params), metrics=metrics, instrument=instrument)
+
+    def stream(self, processes, metrics: Optional[MetricsAccumulator] = None,
+               instrument: Optional[Instrumentation] = None,
+               cache: Optional[ResultCache] = None, **params) -> Iterator[Segment]:
+        """
+        Yield the gantt segments lazily.
+
+        With a `cache`, a run seen before is replayed from it and a new one
+        is stored once fully consumed. Instrumented runs always execute,
+        since there would be nothing to measure otherwise.
+        """
+        args = self.bind(**params)
+        if cache is None or instrument is not None:
+            return self.stream_func(processes, *args, metrics=metrics, instrument=instrument)
+        key = cache_key(processes, self.id, {p.name: v for p, v in zip(self.params, args)})
+        return cached_stream(cache, key, processes,
+                             lambda: self.stream_func(processes, *args, metrics=metrics), metrics)
+
+
+QUANTUM = Param("quantum", "Quantum (Round Robin)", default=2, minimum=1)
+
+ALGORITHMS: Dict[str, Algorithm] = {}
+
+
+def register(algorithm: Algorithm) -> Algorithm:
+    if algorithm.id in ALGORITHMS:
+        raise ValueError(f"Algorithm {algorithm.id!r} is already registered")
+    ALGORITHMS[algorithm.id] = algorithm
+    return algorithm
+
+
+def get_algorithm(algo_id: str) -> Algorithm:
+    try:
+        return ALGORITHMS[algo_id]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {algo_id} "
+                         f"(expected one of {', '.join(ALGORITHMS)})") from None
+
+
+register(Algorithm("fcfs", "FCFS", fcfs, fcfs_stream, key=FCFS_KEY))
+register(Algorithm("sjf_np", "SJF (Non-Preemptive)",
+                   sjf_non_preemptive, sjf_non_preemptive_stream, key=SJF_NP_KEY))
+register(Algorithm("sjf_p", "SJF (Preemptive)",
+                   sjf_preemptive, sjf_preemptive_stream, preemptive=True, key=SJF_P_KEY))
+register(Algorithm("priority_np", "Priority (Non-Preemptive)",
+                   priority_non_preemptive, priority_non_preemptive_stream,
+                   uses_priority=True, key=PRIORITY_KEY))
+register(Algorithm("priority_p", "Priority (Preemptive)",
+                   priority_preemptive, priority_preemptive_stream,
+                   preemptive=True, uses_priority=True, key=PRIORITY_KEY))
+register(Algorithm("rr", "Round Robin", round_robin, round_robin_stream,
+                   params=(QUANTUM,), preemptive=True))
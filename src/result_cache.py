@@ -0,0 +1,267 @@
+# -------------------------------------------------
+# Result cache
+# -------------------------------------------------
+# Content-addressed cache of scheduling runs. The key is a hash of the
+# workload columns plus the algorithm id and its parameters; the value is
+# the gantt and the per-process results. An in-memory LRU sits in front of
+# an optional directory of .npz files that is trimmed by total size.
+#
+#   cache = ResultCache(disk_dir="~/.cache/cpu-scheduler")
+#   gantt = ALGORITHMS["rr"].run(processes, quantum=4, cache=cache)
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+from metrics import MetricsAccumulator
+from schedulers import ScheduleResult, Segment
+from utils import as_table
+
+# Bump when the engines change in a way that changes their output
+CACHE_VERSION = 1
+
+_KEY_COLUMNS = ("pid", "arrival", "burst", "priority", "remaining")
+_RESULT_COLUMNS = ("remaining", "start_time", "completion_time", "response_time")
+
+
+def cache_key(processes, algo_id: str, params: Dict[str, int]) -> str:
+    """Hex digest identifying one run of `algo_id` with `params` on `processes`."""
+    table = as_table(processes)
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"v{CACHE_VERSION}|{algo_id}|{sorted(params.items())}|{len(table)}".encode())
+    for name in _KEY_COLUMNS:
+        column = getattr(table, name)
+        if column.dtype == object:
+            h.update(repr(column.tolist()).encode())
+        else:
+            h.update(column.dtype.str.encode())
+            h.update(np.ascontiguousarray(column).data)
+    return h.hexdigest()
+
+
+class CachedRun(NamedTuple):
+    """The gantt as columns, plus the result columns of the processes."""
+    pid: np.ndarray
+    start: np.ndarray
+    duration: np.ndarray
+    remaining: np.ndarray
+    start_time: np.ndarray
+    completion_time: np.ndarray
+    response_time: np.ndarray
+
+    @classmethod
+    def from_run(cls, gantt: List[Segment], processes) -> "CachedRun":
+        table = as_table(processes)
+        pids, starts, durations = zip(*gantt) if gantt else ((), (), ())
+        pid = np.asarray(pids)
+        if pid.dtype.kind == "U" and not all(isinstance(p, str) for p in pids):
+            # Mixed int/str pids: keep them as objects rather than strings
+            pid = np.array(pids, dtype=object)
+        return cls(pid, np.asarray(starts, dtype=np.int64),
+                   np.asarray(durations, dtype=np.int64),
+                   *(getattr(table, name).copy() for name in _RESULT_COLUMNS))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self)
+
+    def gantt(self) -> List[Segment]:
+        return list(zip(self.pid.tolist(), self.start.tolist(), self.duration.tolist()))
+
+    def write_back(self, processes):
+        ScheduleResult.from_columns(self.remaining, self.start_time,
+                                    self.completion_time, self.response_time).write_back(processes)
+
+
+class ResultCache:
+    """
+    Two-level cache of CachedRun values.
+
+    The memory layer keeps at most `max_entries` runs and `max_bytes` of
+    arrays, evicting the least recently used. With `disk_dir`, runs are
+    also stored there as .npz files, shared by every process using the same
+    directory; the least recently used files are removed once they exceed
+    `max_disk_bytes`. Runs that took less than `min_disk_cost` seconds to
+    compute stay in memory only, since reading a file back would be slower
+    than recomputing them. Safe to use from several threads.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 << 20,
+                 disk_dir: Optional[str] = None, max_disk_bytes: int = 1 << 30,
+                 min_disk_cost: float = 0.01):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir).expanduser() if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.min_disk_cost = min_disk_cost
+        self._disk_bytes: Optional[int] = None    # this process' estimate; rescanned on trim
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, CachedRun]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self):
+        return len(self._memory)
+
+    def get(self, key: str) -> Optional[CachedRun]:
+        with self._lock:
+            run = self._memory.get(key)
+            if run is not None:
+                self._memory.move_to_end(key)
+        if run is None:
+            run = self._load(key)
+            if run is not None:
+                self._remember(key, run)
+        with self._lock:
+            if run is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return run
+
+    def put(self, key: str, run: CachedRun, cost: float = float("inf")):
+        """Store `run`; `cost` is the time in seconds it took to compute."""
+        self._remember(key, run)
+        # Mixed-type pids only exist as pickled objects; keep those in memory
+        if (self.disk_dir is not None and cost >= self.min_disk_cost
+                and run.pid.dtype != object):
+            self._store(key, run)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.npz"):
+                path.unlink(missing_ok=True)
+
+    # ---------------------------------------------
+    # Memory layer
+    # ---------------------------------------------
+    def _remember(self, key: str, run: CachedRun):
+        if run.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._memory[key] = run
+            self._bytes += run.nbytes
+            while len(self._memory) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    # ---------------------------------------------
+    # Disk layer
+    # ---------------------------------------------
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.npz"
+
+    def _load(self, key: str) -> Optional[CachedRun]:
+        if self.disk_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                run = CachedRun(*(data[name] for name in CachedRun._fields))
+            os.utime(path)      # mtime doubles as the last-use time
+            return run
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            # Truncated or foreign file: drop it and recompute
+            path.unlink(missing_ok=True)
+            return None
+
+    def _store(self, key: str, run: CachedRun):
+        # Write to a temporary name and rename, so readers in other
+        # processes never see a half-written file
+        fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **run._asdict())
+                size = f.tell()
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        # Rescan the directory only when it may have outgrown its budget
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += size
+            over = self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._trim_disk()
+
+    def _trim_disk(self):
+        """Remove the least recently used files until the directory fits."""
+        files = []
+        for path in self.disk_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+
+_open_caches: Dict[str, ResultCache] = {}
+
+
+def open_cache(disk_dir: str) -> ResultCache:
+    """
+    This process' ResultCache over `disk_dir`.
+
+    Pool workers call it once per job; the memory layer then carries over
+    between jobs handled by the same worker.
+    """
+    cache = _open_caches.get(disk_dir)
+    if cache is None:
+        cache = _open_caches[disk_dir] = ResultCache(disk_dir=disk_dir)
+    return cache
+
+
+# -------------------------------------------------
+# Cached runs
+# -------------------------------------------------
+def cached_stream(cache: ResultCache, key: str, processes,
+                  make_stream: Callable[[], Iterator[Segment]],
+                  metrics: Optional[MetricsAccumulator] = None) -> Iterator[Segment]:
+    """
+    Stream a run through `cache`, with the same contract as a *_stream.
+
+    A hit replays the stored gantt and then writes the stored results onto
+    `processes`; a miss runs `make_stream()` and stores the run once the
+    stream has been fully consumed.
+    """
+    run = cache.get(key)
+    if run is not None:
+        yield from run.gantt()
+        run.write_back(processes)
+        if metrics is not None:
+            table = as_table(processes)
+            metrics.add_many(table.arrival, table.burst, table.start_time, table.completion_time)
+        return
+
+    gantt = []
+    started = time.perf_counter()
+    for segment in make_stream():
+        gantt.append(segment)
+        yield segment
+    cache.put(key, CachedRun.from_run(gantt, processes), time.perf_counter() - started)
@@ -1,266 +1,534 @@
-from copy import deepcopy
-from typing import List
+import heapq
+from bisect import bisect_right
+from collections import deque
+from typing import Iterator, List, Optional, Sequence, Tuple
 
-class Process:
-    def __init__(self, pid, arrival, burst, priority=1):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.priority = priority
-        self.remaining = burst
+import numpy as np
 
-        # Output values
-        self.start_time = None
-        self.completion_time = None
-        self.response_time = None
+from instrument import Instrumentation
+from metrics import MetricsAccumulator
+from utils import Process, ProcessTable, UNSET, as_table
 
-    def reset(self):
-        self.remaining = self.burst
-        self.start_time = None
-        self.completion_time = None
-        self.response_time = None
+# (pid, start, duration)
+Segment = Tuple[object, int, int]
 
+# Rows converted to Python objects at a time by the vectorized engines
+_CHUNK = 1 << 16
+
+# Ready-queue order of each policy, as column names; the row index (or
+# submission order, in session.py) breaks the remaining ties
+FCFS_KEY = ("arrival",)
+SJF_NP_KEY = ("burst", "arrival")
+SJF_P_KEY = ("remaining", "arrival")
+PRIORITY_KEY = ("priority", "arrival")
 
 # -------------------------------------------------------------
-# ---------------------- FCFS ---------------------------------
+# ------------------- PER-RUN RESULT STATE --------------------
 # -------------------------------------------------------------
-def fcfs(process_list: List[Process]):
-    procs = deepcopy(process_list)
-    procs.sort(key=lambda p: p.arrival)
-
-    time = 0
-    gantt = []
+class ScheduleResult:
+    """
+    Runtime values of one scheduling run, indexed like the input table.
+
+    The engines write here instead of into the processes, so the inputs
+    are left untouched until `write_back()` copies everything over in a
+    single positional pass. If `metrics` is given, engines feed it each
+    process as it completes; if `instrument` is given, they report their
+    event counters and setup time to it.
+    """
+    __slots__ = ("remaining", "start_time", "completion_time", "response_time", "metrics",
+                 "instrument")
+
+    def __init__(self, table: ProcessTable, metrics: Optional[MetricsAccumulator] = None,
+                 instrument: Optional[Instrumentation] = None):
+        n = len(table)
+        self.metrics = metrics
+        self.instrument = instrument
+        self.remaining = table.remaining.tolist()
+        self.start_time = [None] * n
+        self.completion_time = [None] * n
+        self.response_time = [None] * n
+
+    @classmethod
+    def from_columns(cls, remaining, start_time, completion_time, response_time) -> "ScheduleResult":
+        """Result of an earlier run, e.g. one read back from a cache, ready to write back."""
+        result = cls.__new__(cls)
+        result.metrics = result.instrument = None
+        result.remaining = remaining
+        result.start_time = start_time
+        result.completion_time = completion_time
+        result.response_time = response_time
+        return result
+
+    def write_back(self, processes):
+        # Vectorized engines store NumPy arrays instead of lists
+        if isinstance(processes, ProcessTable):
+            processes.remaining[:] = self.remaining
+            for name in ("start_time", "completion_time", "response_time"):
+                values = getattr(self, name)
+                if not isinstance(values, np.ndarray):
+                    values = [UNSET if v is None else v for v in values]
+                getattr(processes, name)[:] = values
+            return
+
+        start_time, completion_time, response_time, remaining = (
+            v.tolist() if isinstance(v, np.ndarray) else v
+            for v in (self.start_time, self.completion_time,
+                      self.response_time, self.remaining)
+        )
+        for idx, p in enumerate(processes):
+            p.start_time = start_time[idx]
+            p.completion_time = completion_time[idx]
+            p.response_time = response_time[idx]
+            p.remaining = remaining[idx]
+
+
+def _key_func(table: ProcessTable, result: ScheduleResult, key: Sequence[str]):
+    """
+    Build an index -> sort key function from column names.
+
+    "remaining" reads the live value from `result`; every other name is a
+    column of `table`.
+    """
+    cols = [result.remaining if name == "remaining" else getattr(table, name).tolist()
+            for name in key]
+    if len(cols) == 1:
+        return cols[0].__getitem__
+    if "remaining" not in key:
+        return list(zip(*cols)).__getitem__
+    if len(cols) == 2:
+        first, second = cols
+        return lambda idx: (first[idx], second[idx])
+    return lambda idx: tuple(col[idx] for col in cols)
+
+
+def stream_engine(engine, processes, *args,
+                  metrics: Optional[MetricsAccumulator] = None,
+                  instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    """
+    Yield the gantt segments of `engine` on a Process list or ProcessTable.
+
+    Segments come out as soon as they are final. Results are written back
+    onto `processes` only once the stream has been fully consumed.
+    """
+    if instrument is not None:
+        instrument.start()
+    table = as_table(processes)
+    result = ScheduleResult(table, metrics, instrument)
+    yield from engine(table, result, *args)
+    if instrument is not None:
+        instrument.lap("loop")
+    result.write_back(processes)
+    if instrument is not None:
+        instrument.lap("sync")
+
+
+def run_engine(engine, processes, *args,
+               metrics: Optional[MetricsAccumulator] = None,
+               instrument: Optional[Instrumentation] = None) -> List[Segment]:
+    """Run `engine` to completion and return the whole gantt as a list."""
+    return list(stream_engine(engine, processes, *args, metrics=metrics, instrument=instrument))
 
-    for p in procs:
-        if time < p.arrival:
-            time = p.arrival
 
-        p.start_time = time
-        p.response_time = p.start_time - p.arrival
-        gantt.append((p.pid, time, p.burst))
-        time += p.burst
-        p.completion_time = time
-
-    _sync(process_list, procs)
-    return gantt
+# -------------------------------------------------------------
+# ----------------------- FCFS ENGINE -------------------------
+# -------------------------------------------------------------
+def fcfs_completion_times(arrival: np.ndarray, burst: np.ndarray) -> np.ndarray:
+    """
+    Completion times of jobs run back to back in the given order.
+
+    Vectorized form of completion[i] = max(completion[i-1], arrival[i]) + burst[i]:
+    with S the running sum of bursts, completion[i] = S[i] + max over j <= i
+    of (arrival[j] - S[j-1]), which is a cumulative maximum.
+    """
+    total = np.cumsum(burst, dtype=np.int64)
+    slack = arrival.astype(np.int64) - (total - burst)
+    np.maximum.accumulate(slack, out=slack)
+    np.maximum(slack, 0, out=slack)
+    return total + slack
+
+
+def fcfs_schedule(table: ProcessTable, result: ScheduleResult,
+                  key: Sequence[str] = FCFS_KEY) -> Iterator[Segment]:
+    """Run FCFS in the order given by the `key` columns, yielding gantt segments."""
+    # np.lexsort is stable and treats its last key as the primary one
+    order = np.lexsort([getattr(table, name) for name in reversed(key)])
+    arrival = table.arrival[order]
+    burst = table.burst[order]
+    if result.instrument is not None:
+        result.instrument.lap("setup")
+
+    completion = fcfs_completion_times(arrival, burst)
+    start = completion - burst
+
+    result.start_time = np.empty(len(table), dtype=np.int64)
+    result.start_time[order] = start
+    result.response_time = np.empty(len(table), dtype=np.int64)
+    result.response_time[order] = start - arrival
+    result.completion_time = np.empty(len(table), dtype=np.int64)
+    result.completion_time[order] = completion
+    result.remaining = np.zeros(len(table), dtype=np.int32)
+    if result.metrics is not None:
+        result.metrics.add_many(arrival, burst, start, completion)
+
+    pids = table.pid[order]
+    if result.instrument is not None and len(table):
+        # No heap here: the sorted order is the ready queue, and each
+        # process runs exactly once
+        n = len(table)
+        result.instrument.count(
+            dispatches=n, ready_inserts=n, ready_extracts=n, segments=n,
+            context_switches=int(np.count_nonzero(pids[1:] != pids[:-1])),
+            idle_jumps=int(np.count_nonzero(start[1:] > completion[:-1])) + int(start[0] > 0),
+        )
+
+    for lo in range(0, len(table), _CHUNK):
+        hi = lo + _CHUNK
+        yield from zip(pids[lo:hi].tolist(), start[lo:hi].tolist(), burst[lo:hi].tolist())
 
 
 # -------------------------------------------------------------
-# ------------------- SJF NON-PREEMPTIVE ----------------------
+# ------------- EVENT-DRIVEN PREEMPTIVE ENGINE ----------------
 # -------------------------------------------------------------
-def sjf_non_preemptive(process_list: List[Process]):
-    procs = deepcopy(process_list)
+def preemptive_schedule(table: ProcessTable, result: ScheduleResult,
+                        key: Sequence[str]) -> Iterator[Segment]:
+    """
+    Run a preemptive schedule over `table`, yielding gantt segments.
+
+    Instead of stepping one time unit per loop, the running process is
+    executed until the next arrival or its own completion, whichever comes
+    first. Ready processes live in a heap ordered by the `key` columns, with
+    the row index as the final tie-breaker (same as `min()` over a list).
+    The key must not get worse as a process runs, which holds for
+    remaining time and for static priority.
+    """
+    pid = table.pid.tolist()
+    arrival = table.arrival.tolist()
+    burst = table.burst.tolist() if result.metrics is not None else None
+    key_of = _key_func(table, result, key)
+    n = len(table)
+    order = sorted(range(n), key=arrival.__getitem__)
+    remaining = result.remaining
+    start_time = result.start_time
+    ready = []
+    pending = None
     time = 0
-    completed = 0
-    gantt = []
-    n = len(procs)
-
-    while completed < n:
-        ready = [p for p in procs if p.arrival <= time and p.completion_time is None]
+    i = 0
+    dispatches = merges = switches = idle = 0
+    if result.instrument is not None:
+        result.instrument.lap("setup")
+
+    while i < n or ready:
+        # Admit everything that has arrived by now
+        while i < n and arrival[order[i]] <= time:
+            idx = order[i]
+            heapq.heappush(ready, (key_of(idx), idx))
+            i += 1
 
         if not ready:
-            time = min(p.arrival for p in procs if p.completion_time is None)
+            # CPU idle: jump straight to the next arrival
+            time = arrival[order[i]]
+            idle += 1
             continue
 
-        current = min(ready, key=lambda p: (p.burst, p.arrival))
+        _, idx = heapq.heappop(ready)
+        dispatches += 1
+
+        if start_time[idx] is None:
+            start_time[idx] = time
+            result.response_time[idx] = time - arrival[idx]
 
-        if current.start_time is None:
-            current.start_time = time
-            current.response_time = current.start_time - current.arrival
+        # Run until completion or the next arrival (possible preemption)
+        run = remaining[idx]
+        if i < n:
+            run = min(run, arrival[order[i]] - time)
 
-        gantt.append((current.pid, time, current.burst))
-        time += current.burst
-        current.completion_time = time
-        current.remaining = 0
-        completed += 1
+        # A segment is final once a different process (or a gap) follows it
+        if pending is not None and pending[0] == pid[idx] and pending[1] + pending[2] == time:
+            pending[2] += run
+            merges += 1
+        else:
+            if pending is not None:
+                switches += pending[0] != pid[idx]
+                yield tuple(pending)
+            pending = [pid[idx], time, run]
+
+        time += run
+        remaining[idx] -= run
 
-    _sync(process_list, procs)
-    return gantt
+        if remaining[idx] == 0:
+            result.completion_time[idx] = time
+            if result.metrics is not None:
+                result.metrics.add(arrival[idx], burst[idx], start_time[idx], time)
+        else:
+            heapq.heappush(ready, (key_of(idx), idx))
+
+    if pending is not None:
+        yield tuple(pending)
+    if result.instrument is not None:
+        # Every queued entry is popped again, so inserts == extracts
+        result.instrument.count(dispatches=dispatches, ready_inserts=dispatches,
+                                ready_extracts=dispatches, context_switches=switches,
+                                idle_jumps=idle, gantt_merges=merges,
+                                segments=dispatches - merges)
 
 
 # -------------------------------------------------------------
-# ------------------- SJF PREEMPTIVE --------------------------
+# ------------- HEAP-BASED NON-PREEMPTIVE ENGINE --------------
 # -------------------------------------------------------------
-def sjf_preemptive(process_list: List[Process]):
-    procs = deepcopy(process_list)
+def nonpreemptive_schedule(table: ProcessTable, result: ScheduleResult,
+                           key: Sequence[str]) -> Iterator[Segment]:
+    """
+    Run a non-preemptive schedule over `table`, yielding gantt segments.
+
+    Arrivals are fed from a pre-sorted cursor into a heap ordered by the
+    `key` columns, with the row index as the final tie-breaker, so each
+    dispatch is O(log n). Idle gaps are skipped in one step.
+    """
+    pid = table.pid.tolist()
+    arrival = table.arrival.tolist()
+    burst = table.burst.tolist()
+    key_of = _key_func(table, result, key)
+    n = len(table)
+    order = sorted(range(n), key=arrival.__getitem__)
+    ready = []
     time = 0
-    completed = 0
-    gantt = []
-    n = len(procs)
+    i = 0
+    switches = idle = 0
     last_pid = None
+    if result.instrument is not None:
+        result.instrument.lap("setup")
 
-    while completed < n:
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
+    while i < n or ready:
+        while i < n and arrival[order[i]] <= time:
+            idx = order[i]
+            heapq.heappush(ready, (key_of(idx), idx))
+            i += 1
 
         if not ready:
-            time = min(p.arrival for p in procs if p.remaining > 0)
-            last_pid = None
+            time = arrival[order[i]]
+            idle += 1
             continue
 
-        current = min(ready, key=lambda p: (p.remaining, p.arrival))
+        _, idx = heapq.heappop(ready)
 
-        if current.start_time is None:
-            current.start_time = time
-            current.response_time = current.start_time - current.arrival
+        result.start_time[idx] = time
+        result.response_time[idx] = time - arrival[idx]
 
-        # Gantt block begins
-        if last_pid != current.pid:
-            gantt.append((current.pid, time, 1))
-        else:
-            pid, start, dur = gantt.pop()
-            gantt.append((pid, start, dur + 1))
-
-        current.remaining -= 1
-        time += 1
-        last_pid = current.pid
+        if last_pid is not None:
+            switches += last_pid != pid[idx]
+        last_pid = pid[idx]
 
-        if current.remaining == 0:
-            current.completion_time = time
-            completed += 1
+        yield (pid[idx], time, burst[idx])
+        time += burst[idx]
+        result.completion_time[idx] = time
+        result.remaining[idx] = 0
+        if result.metrics is not None:
+            result.metrics.add(arrival[idx], burst[idx], result.start_time[idx], time)
 
-    _sync(process_list, procs)
-    return gantt
+    if result.instrument is not None:
+        result.instrument.count(dispatches=n, ready_inserts=n, ready_extracts=n,
+                                context_switches=switches, idle_jumps=idle, segments=n)
 
 
 # -------------------------------------------------------------
-# -------------- PRIORITY NON-PREEMPTIVE ----------------------
+# ---------------- DEQUE-BASED ROUND ROBIN ENGINE -------------
 # -------------------------------------------------------------
-def priority_non_preemptive(process_list: List[Process]):
-    procs = deepcopy(process_list)
+def rr_solo_run(quantum: int, remaining: int, now: int, next_arrival: Optional[int]) -> int:
+    """
+    CPU time a Round Robin process gets when it is dispatched alone at `now`.
+
+    With nobody else ready it keeps the CPU for every quantum that ends
+    before `next_arrival`, plus the quantum that arrival falls into, so
+    those slices can be merged into one gantt segment.
+    """
+    if next_arrival is None:
+        return remaining
+    slices = max(1, -(-(next_arrival - now) // quantum))
+    return min(slices * quantum, remaining)
+
+
+def round_robin_schedule(table: ProcessTable, result: ScheduleResult,
+                         quantum: int) -> Iterator[Segment]:
+    """
+    Run Round Robin over `table`, yielding gantt segments.
+
+    The ready queue is a deque of row indices, and arrivals are admitted in
+    bulk by bisecting a sorted arrival array. A process that is alone in
+    the queue keeps the CPU for as many quanta as fit before the next
+    arrival, and those slices are coalesced into a single gantt segment.
+    """
+    pid = table.pid.tolist()
+    arrival = table.arrival.tolist()
+    burst = table.burst.tolist() if result.metrics is not None else None
+    by_arrival = sorted(range(len(table)), key=arrival.__getitem__)
+    arrivals = [arrival[idx] for idx in by_arrival]
+    n = len(by_arrival)
+    remaining = result.remaining
+
     time = 0
-    completed = 0
-    gantt = []
-    n = len(procs)
+    i = 0
+    pending = None
+    queue = deque()
+    dispatches = merges = switches = idle = 0
+    if result.instrument is not None:
+        result.instrument.lap("setup")
+
+    while queue or i < n:
+        # Admit all arrivals up to now
+        j = bisect_right(arrivals, time, i)
+        queue.extend(by_arrival[i:j])
+        i = j
+
+        if not queue:
+            time = arrivals[i]
+            idle += 1
+            continue
 
-    while completed < n:
-        ready = [p for p in procs if p.arrival <= time and p.completion_time is None]
+        idx = queue.popleft()
+        dispatches += 1
 
-        if not ready:
-            time = min(p.arrival for p in procs if p.completion_time is None)
-            continue
+        if result.start_time[idx] is None:
+            result.start_time[idx] = time
+            result.response_time[idx] = time - arrival[idx]
+
+        if queue:
+            run = min(quantum, remaining[idx])
+        else:
+            run = rr_solo_run(quantum, remaining[idx], time, arrivals[i] if i < n else None)
+
+        # A segment is final once a different process (or a gap) follows it
+        if pending is not None and pending[0] == pid[idx] and pending[1] + pending[2] == time:
+            pending[2] += run
+            merges += 1
+        else:
+            if pending is not None:
+                switches += pending[0] != pid[idx]
+                yield tuple(pending)
+            pending = [pid[idx], time, run]
 
-        current = min(ready, key=lambda p: (p.priority, p.arrival))
+        time += run
+        remaining[idx] -= run
 
-        if current.start_time is None:
-            current.start_time = time
-            current.response_time = current.start_time - current.arrival
+        # Arrivals during the slice queue up ahead of the preempted process
+        j = bisect_right(arrivals, time, i)
+        queue.extend(by_arrival[i:j])
+        i = j
 
-        gantt.append((current.pid, time, current.burst))
-        time += current.burst
-        current.completion_time = time
-        current.remaining = 0
-        completed += 1
+        if remaining[idx] > 0:
+            queue.append(idx)
+        else:
+            result.completion_time[idx] = time
+            if result.metrics is not None:
+                result.metrics.add(arrival[idx], burst[idx], result.start_time[idx], time)
 
-    _sync(process_list, procs)
-    return gantt
+    if pending is not None:
+        yield tuple(pending)
+    if result.instrument is not None:
+        # Every queued entry is popped again, so inserts == extracts
+        result.instrument.count(dispatches=dispatches, ready_inserts=dispatches,
+                                ready_extracts=dispatches, context_switches=switches,
+                                idle_jumps=idle, gantt_merges=merges,
+                                segments=dispatches - merges)
 
 
 # -------------------------------------------------------------
-# -------------- PRIORITY PREEMPTIVE --------------------------
+# ---------------------- FCFS ---------------------------------
 # -------------------------------------------------------------
-def priority_preemptive(process_list: List[Process]):
-    procs = deepcopy(process_list)
-    time = 0
-    completed = 0
-    gantt = []
-    n = len(procs)
-    last_pid = None
-
-    while completed < n:
-        ready = [p for p in procs if p.arrival <= time and p.remaining > 0]
+def fcfs(process_list: List[Process],
+         metrics: Optional[MetricsAccumulator] = None,
+         instrument: Optional[Instrumentation] = None):
+    return run_engine(fcfs_schedule, process_list, FCFS_KEY,
+                      metrics=metrics, instrument=instrument)
 
-        if not ready:
-            time = min(p.arrival for p in procs if p.remaining > 0)
-            last_pid = None
-            continue
 
-        current = min(ready, key=lambda p: (p.priority, p.arrival))
+def fcfs_stream(process_list: List[Process],
+                metrics: Optional[MetricsAccumulator] = None,
+                instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(fcfs_schedule, process_list, FCFS_KEY,
+                         metrics=metrics, instrument=instrument)
 
-        if current.start_time is None:
-            current.start_time = time
-            current.response_time = current.start_time - current.arrival
-
-        if last_pid != current.pid:
-            gantt.append((current.pid, time, 1))
-        else:
-            pid, start, dur = gantt.pop()
-            gantt.append((pid, start, dur + 1))
 
-        current.remaining -= 1
-        time += 1
-        last_pid = current.pid
+# -------------------------------------------------------------
+# ------------------- SJF NON-PREEMPTIVE ----------------------
+# -------------------------------------------------------------
+def sjf_non_preemptive(process_list: List[Process],
+                       metrics: Optional[MetricsAccumulator] = None,
+                       instrument: Optional[Instrumentation] = None):
+    return run_engine(nonpreemptive_schedule, process_list, SJF_NP_KEY,
+                      metrics=metrics, instrument=instrument)
 
-        if current.remaining == 0:
-            current.completion_time = time
-            completed += 1
 
-    _sync(process_list, procs)
-    return gantt
+def sjf_non_preemptive_stream(process_list: List[Process],
+                              metrics: Optional[MetricsAccumulator] = None,
+                              instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(nonpreemptive_schedule, process_list, SJF_NP_KEY,
+                         metrics=metrics, instrument=instrument)
 
 
 # -------------------------------------------------------------
-# --------------------- ROUND ROBIN ---------------------------
+# ------------------- SJF PREEMPTIVE --------------------------
 # -------------------------------------------------------------
-def round_robin(process_list: List[Process], quantum: int):
-    procs = deepcopy(process_list)
+def sjf_preemptive(process_list: List[Process],
+                   metrics: Optional[MetricsAccumulator] = None,
+                   instrument: Optional[Instrumentation] = None):
+    return run_engine(preemptive_schedule, process_list, SJF_P_KEY,
+                      metrics=metrics, instrument=instrument)
 
-    time = 0
-    i = 0
-    gantt = []
-    queue = []
 
-    procs_by_arrival = sorted(procs, key=lambda p: p.arrival)
-    n = len(procs)
+def sjf_preemptive_stream(process_list: List[Process],
+                          metrics: Optional[MetricsAccumulator] = None,
+                          instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(preemptive_schedule, process_list, SJF_P_KEY,
+                         metrics=metrics, instrument=instrument)
 
-    # Load initial arrivals
-    while i < n and procs_by_arrival[i].arrival <= time:
-        queue.append(procs_by_arrival[i])
-        i += 1
 
-    if not queue and i < n:
-        time = procs_by_arrival[i].arrival
-        queue.append(procs_by_arrival[i])
-        i += 1
+# -------------------------------------------------------------
+# -------------- PRIORITY NON-PREEMPTIVE ----------------------
+# -------------------------------------------------------------
+def priority_non_preemptive(process_list: List[Process],
+                            metrics: Optional[MetricsAccumulator] = None,
+                            instrument: Optional[Instrumentation] = None):
+    return run_engine(nonpreemptive_schedule, process_list, PRIORITY_KEY,
+                      metrics=metrics, instrument=instrument)
 
-    while queue:
-        cur = queue.pop(0)
 
-        if cur.start_time is None:
-            cur.start_time = time
-            cur.response_time = cur.start_time - cur.arrival
+def priority_non_preemptive_stream(
+        process_list: List[Process],
+        metrics: Optional[MetricsAccumulator] = None,
+        instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(nonpreemptive_schedule, process_list, PRIORITY_KEY,
+                         metrics=metrics, instrument=instrument)
 
-        run = min(quantum, cur.remaining)
-        gantt.append((cur.pid, time, run))
-        time += run
-        cur.remaining -= run
 
-        # Add arrivals during execution
-        while i < n and procs_by_arrival[i].arrival <= time:
-            queue.append(procs_by_arrival[i])
-            i += 1
-
-        if cur.remaining > 0:
-            queue.append(cur)
-        else:
-            cur.completion_time = time
+# -------------------------------------------------------------
+# -------------- PRIORITY PREEMPTIVE --------------------------
+# -------------------------------------------------------------
+def priority_preemptive(process_list: List[Process],
+                        metrics: Optional[MetricsAccumulator] = None,
+                        instrument: Optional[Instrumentation] = None):
+    return run_engine(preemptive_schedule, process_list, PRIORITY_KEY,
+                      metrics=metrics, instrument=instrument)
 
-        if not queue and i < n:
-            time = procs_by_arrival[i].arrival
-            queue.append(procs_by_arrival[i])
-            i += 1
 
-    _sync(process_list, procs)
-    return gantt
+def priority_preemptive_stream(process_list: List[Process],
+                               metrics: Optional[MetricsAccumulator] = None,
+                               instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(preemptive_schedule, process_list, PRIORITY_KEY,
+                         metrics=metrics, instrument=instrument)
 
 
 # -------------------------------------------------------------
-# ----------- UTILITY TO SYNC RESULTS BACK TO ORIGINAL --------
+# --------------------- ROUND ROBIN ---------------------------
 # -------------------------------------------------------------
-def _sync(orig_list, new_list):
-    for orig in orig_list:
-        for p in new_list:
-            if p.pid == orig.pid:
-                orig.start_time = p.start_time
-                orig.completion_time = p.completion_time
-                orig.response_time = p.response_time
-                orig.remaining = p.remaining
+def round_robin(process_list: List[Process], quantum: int,
+                metrics: Optional[MetricsAccumulator] = None,
+                instrument: Optional[Instrumentation] = None):
+    return run_engine(round_robin_schedule, process_list, quantum,
+                      metrics=metrics, instrument=instrument)
+
+
+def round_robin_stream(process_list: List[Process], quantum: int,
+                       metrics: Optional[MetricsAccumulator] = None,
+                       instrument: Optional[Instrumentation] = None) -> Iterator[Segment]:
+    return stream_engine(round_robin_schedule, process_list, quantum,
+                         metrics=metrics, instrument=instrument)
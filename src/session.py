@@ -0,0 +1,210 @@
+# -------------------------------------------------
+# Online scheduler session
+# -------------------------------------------------
+# Drives the registered policies (registry.py) from a live job feed: processes
+# are submitted while the simulation runs, and the Gantt chart and metrics
+# grow incrementally instead of re-running the whole schedule.
+#
+#   session = SchedulerSession("rr", quantum=2)
+#   session.submit(Process("P1", 0, 5))
+#   session.advance(until=3)
+#   session.submit(Process("P2", 3, 2))
+#   session.drain()
+import heapq
+from collections import deque
+from typing import Dict, List
+
+from metrics import MetricsAccumulator
+from registry import QUANTUM, get_algorithm
+from schedulers import Segment, rr_solo_run
+
+
+INF = float("inf")
+
+
+class SchedulerSession:
+    """
+    Incremental scheduler over an open-ended stream of processes.
+
+    `algorithm` is an id from registry.ALGORITHMS and `params` its extra
+    parameters (`quantum=` for Round Robin). `submit()` adds a process
+    whose arrival is not in the past, `advance()` moves the clock forward,
+    and `drain()` runs until every submitted process has finished. Each
+    operation costs amortized O(log n). The runtime fields of submitted
+    processes (start_time, completion_time, response_time, remaining) are
+    filled in as they become known.
+
+    The ready queue is ordered by the algorithm's registered key, with the
+    submission number as the final tie-breaker, so submitting everything
+    up front and calling `drain()` gives the same Gantt chart as the
+    registered scheduler. Decisions at the time the clock stopped are
+    deferred to the next call, so processes submitted with exactly that
+    arrival are still taken into account.
+    """
+
+    def __init__(self, algorithm: str, **params):
+        algo = get_algorithm(algorithm)
+        bound = dict(zip((p.name for p in algo.params), algo.bind(**params)))
+
+        self.algorithm = algo.id
+        self.quantum = bound.get(QUANTUM.name)
+        self._rr = self.quantum is not None
+        self._key = algo.key
+        self._preemptive = algo.preemptive and not self._rr
+
+        self.now = 0
+        self.gantt: List[Segment] = []
+        self._procs = []                         # submitted processes, by seq
+        self._arrivals = []                      # heap of (arrival, seq)
+        self._ready = deque() if self._rr else []
+        self._running = None                     # seq of the process on the CPU
+        self._slice_end = 0                      # when the running slice ends
+        self._slice_base = 0                     # dispatch time of a solo RR run
+
+        self.completed = 0
+        self.stats = MetricsAccumulator()
+
+    # ---------------------------------------------
+    # Public API
+    # ---------------------------------------------
+    def submit(self, process):
+        """Add a process to the session. Its arrival must not be before `now`."""
+        if process.arrival < self.now:
+            raise ValueError(
+                f"{process.pid}: arrival {process.arrival} is before the session time {self.now}"
+            )
+
+        seq = len(self._procs)
+        self._procs.append(process)
+        process.remaining = process.burst
+        process.start_time = None
+        process.completion_time = None
+        process.response_time = None
+        heapq.heappush(self._arrivals, (process.arrival, seq))
+
+        # A solo Round Robin run was sized for the arrivals known at its
+        # dispatch; cut it short for this one
+        if self._rr and self._running is not None and process.arrival < self._slice_end:
+            base = self._slice_base
+            run = rr_solo_run(self.quantum, self._slice_end - base, base, process.arrival)
+            self._slice_end = max(self.now, base + run)
+
+    def advance(self, until) -> List[Segment]:
+        """Simulate up to time `until` and return the slices executed in this call."""
+        if until < self.now:
+            raise ValueError(f"Cannot advance to {until}: session time is already {self.now}")
+
+        executed = []
+        procs = self._procs
+
+        while True:
+            if self._running is None:
+                self._admit()
+                if not self._ready:
+                    if not self._arrivals or self._arrivals[0][0] >= until:
+                        if until != INF:
+                            self.now = until
+                        break
+                    self.now = self._arrivals[0][0]
+                    continue
+                if self.now >= until:
+                    # More processes may still arrive at exactly this time
+                    break
+                self._dispatch()
+
+            seq = self._running
+            p = procs[seq]
+            event = self._slice_end
+            if self._preemptive and self._arrivals:
+                event = min(event, self._arrivals[0][0])
+
+            finishes = p.remaining - (event - self.now) == 0
+            if event > until or (event == until and not finishes):
+                # Stop mid-slice; the rest is decided on the next call
+                self._execute(p, until - self.now, executed)
+                break
+
+            self._execute(p, event - self.now, executed)
+            self._running = None
+
+            if p.remaining == 0:
+                self._complete(p)
+            elif self._rr:
+                # Same order as round_robin_schedule: admit, then requeue
+                self._admit()
+                self._ready.append(seq)
+            else:
+                self._push(seq)
+
+        return executed
+
+    def drain(self) -> List[Segment]:
+        """Run until every submitted process has completed."""
+        return self.advance(INF)
+
+    def metrics(self) -> Dict[str, float]:
+        """TAT/WT/RT averages, spread and percentiles over the processes completed so far."""
+        return self.stats.summary()
+
+    @property
+    def pending(self) -> int:
+        """Processes submitted but not completed yet."""
+        return len(self._procs) - self.completed
+
+    # ---------------------------------------------
+    # Internals
+    # ---------------------------------------------
+    def _push(self, seq):
+        # Process attributes stand in for the table columns, "remaining"
+        # included, so the key reads the same as in the batch engines
+        p = self._procs[seq]
+        heapq.heappush(self._ready, (tuple(getattr(p, name) for name in self._key), seq))
+
+    def _admit(self):
+        arrivals = self._arrivals
+        while arrivals and arrivals[0][0] <= self.now:
+            _, seq = heapq.heappop(arrivals)
+            if self._rr:
+                self._ready.append(seq)
+            else:
+                self._push(seq)
+
+    def _dispatch(self):
+        if self._rr:
+            seq = self._ready.popleft()
+        else:
+            _, seq = heapq.heappop(self._ready)
+        p = self._procs[seq]
+
+        if p.start_time is None:
+            p.start_time = self.now
+            p.response_time = self.now - p.arrival
+
+        run = p.remaining
+        if self._rr:
+            if self._ready:
+                run = min(self.quantum, p.remaining)
+            else:
+                next_arrival = self._arrivals[0][0] if self._arrivals else None
+                run = rr_solo_run(self.quantum, p.remaining, self.now, next_arrival)
+
+        self._running = seq
+        self._slice_base = self.now
+        self._slice_end = self.now + run
+
+    def _execute(self, p, run, executed):
+        if run <= 0:
+            return
+        for gantt in (self.gantt, executed):
+            if gantt and gantt[-1][0] == p.pid and gantt[-1][1] + gantt[-1][2] == self.now:
+                pid, start, dur = gantt.pop()
+                gantt.append((pid, start, dur + run))
+            else:
+                gantt.append((p.pid, self.now, run))
+        self.now += run
+        p.remaining -= run
+
+    def _complete(self, p):
+        p.completion_time = self.now
+        self.completed += 1
+        self.stats.add(p.arrival, p.burst, p.start_time, p.completion_time)
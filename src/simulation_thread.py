@@ -0,0 +1,96 @@
+# -------------------------------------------------
+# Background simulation runs
+# -------------------------------------------------
+# SimulationThread runs one registered algorithm off the GUI thread. It
+# reports progress as simulated time, stops early when interrupted, and
+# hands the finished gantt back through a signal; the per-process results
+# are written onto the processes before that signal fires. Given a
+# ResultCache, a run seen before is replayed from it instead.
+#
+#   thread = SimulationThread(ALGORITHMS["rr"], processes, {"quantum": 4})
+#   thread.progress.connect(on_progress)
+#   thread.completed.connect(on_gantt)
+#   thread.start()
+#   ...
+#   thread.cancel()
+import time
+from itertools import islice
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from registry import Algorithm
+from result_cache import ResultCache
+from schedulers import fcfs_completion_times
+from utils import as_table
+
+# Segments pulled between cancellation checks
+BATCH = 4096
+
+# Seconds between progress signals
+PROGRESS_INTERVAL = 0.05
+
+
+def schedule_end_time(processes) -> int:
+    """
+    Time at which the last process completes.
+
+    All the registered algorithms keep the CPU busy whenever a process is
+    ready, so they all finish at the FCFS end time.
+    """
+    table = as_table(processes)
+    if not len(table):
+        return 0
+    order = np.argsort(table.arrival, kind="stable")
+    return int(fcfs_completion_times(table.arrival[order], table.burst[order])[-1])
+
+
+class SimulationThread(QThread):
+    """Run `algorithm` on `processes` in a worker thread."""
+
+    progress = pyqtSignal(float, float)   # simulated time reached, end time
+    completed = pyqtSignal(object)        # the whole gantt, as a list
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, algorithm: Algorithm, processes, params=None,
+                 cache: Optional[ResultCache] = None, parent=None):
+        super().__init__(parent)
+        self.algorithm = algorithm
+        self.processes = processes
+        self.params = params or {}
+        self.cache = cache
+
+    def cancel(self):
+        """Ask the run to stop; safe to call from any thread."""
+        self.requestInterruption()
+
+    def run(self):
+        try:
+            end = schedule_end_time(self.processes)
+            stream = self.algorithm.stream(self.processes, cache=self.cache, **self.params)
+            gantt = []
+            next_report = 0.0
+            while True:
+                size = len(gantt)
+                gantt.extend(islice(stream, BATCH))
+                if self.isInterruptionRequested():
+                    # Results are only written back once the stream is
+                    # exhausted, so the processes are left untouched
+                    stream.close()
+                    self.cancelled.emit()
+                    return
+                if len(gantt) - size < BATCH:
+                    break
+                now = time.perf_counter()
+                if now >= next_report:
+                    _, start, duration = gantt[-1]
+                    self.progress.emit(start + duration, end)
+                    next_report = now + PROGRESS_INTERVAL
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        self.progress.emit(end, end)
+        self.completed.emit(gantt)
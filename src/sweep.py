@@ -0,0 +1,152 @@
+# -------------------------------------------------
+# Round Robin quantum sweep
+# -------------------------------------------------
+# Sorts one workload by arrival, places it in shared memory once and
+# evaluates many quanta in parallel workers that map the same block.
+#
+#   python src/sweep.py --processes 100000 --quanta 1 2 4 8 16 --out sweep.csv
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from batch import write_csv
+from loaders import load_workload
+from registry import ALGORITHMS
+from result_cache import open_cache
+from utils import ProcessTable, as_table, compute_metrics, random_workload
+
+
+# Column layout of the shared block, one region per field in this order.
+# Each uses the dtype ProcessTable keeps, so the table's columns are views
+# of the block rather than copies; the int64 regions come first to keep
+# every region aligned.
+_COLUMNS = (("pid", np.int64), ("arrival", np.int64),
+            ("burst", np.int32), ("priority", np.int32))
+
+
+def context_switches(gantt) -> int:
+    """Number of times the CPU moves from one process to a different one."""
+    return sum(1 for a, b in zip(gantt, gantt[1:]) if a[0] != b[0])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: pool workers share the parent's resource tracker,
+        # so the extra registration is harmless and the parent still unlinks
+        return shared_memory.SharedMemory(name=name)
+
+
+def _block_size(n: int) -> int:
+    return sum(np.dtype(dtype).itemsize for _, dtype in _COLUMNS) * n
+
+
+def _column_views(buf, n: int) -> Dict[str, np.ndarray]:
+    """The _COLUMNS regions of a shared block holding `n` processes."""
+    views = {}
+    offset = 0
+    for name, dtype in _COLUMNS:
+        views[name] = np.ndarray(n, dtype=dtype, buffer=buf, offset=offset)
+        offset += views[name].nbytes
+    return views
+
+
+def _table_view(buf, n: int) -> ProcessTable:
+    """ProcessTable whose input columns are views into `buf` (no copy)."""
+    cols = _column_views(buf, n)
+    return ProcessTable(cols["pid"], cols["arrival"], cols["burst"], cols["priority"])
+
+
+def _evaluate(table: ProcessTable, quantum: int, cache_dir: Optional[str] = None) -> Dict:
+    table.reset()
+    cache = open_cache(cache_dir) if cache_dir else None
+    gantt = ALGORITHMS["rr"].run(table, quantum=quantum, cache=cache)
+    row = {"quantum": quantum}
+    row.update(compute_metrics(table))
+    row["context_switches"] = context_switches(gantt)
+    return row
+
+
+def _run_quantum(job) -> Dict:
+    name, n, quantum, cache_dir = job
+    shm = _attach(name)
+    try:
+        return _evaluate(_table_view(shm.buf, n), quantum, cache_dir)
+    finally:
+        shm.close()
+
+
+def sweep_quantum(processes, quanta: Sequence[int],
+                  workers: Optional[int] = None,
+                  cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Evaluate Round Robin for every quantum in `quanta` on one workload.
+
+    The workload is sorted by arrival once and copied into a shared memory
+    block; each worker maps that block and runs one quantum on it. Returns
+    one row per quantum with avg TAT/WT/RT and the context-switch count.
+    With `cache_dir`, quanta already evaluated on the same workload are
+    read back from an on-disk ResultCache. Input processes are not modified.
+    """
+    table = as_table(processes)
+    n = len(table)
+    order = np.argsort(table.arrival, kind="stable")
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, _block_size(n)))
+    try:
+        cols = _column_views(shm.buf, n)
+        # Stable sort keeps the original order among equal arrivals, which
+        # is also Round Robin's tie-break, so the schedule is unchanged.
+        # Pids are stored as row numbers; they are only compared, never shown.
+        cols["pid"][:] = order
+        for name in ("arrival", "burst", "priority"):
+            cols[name][:] = getattr(table, name)[order]
+        del cols
+
+        if workers == 1:
+            view = _table_view(shm.buf, n)
+            rows = [_evaluate(view, q, cache_dir) for q in quanta]
+            del view
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rows = list(pool.map(_run_quantum, [(shm.name, n, q, cache_dir) for q in quanta]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return sorted(rows, key=lambda r: r["quantum"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Round Robin quantum sweep")
+    parser.add_argument("--processes", type=int, default=10000, help="size of the random workload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workload", help="CSV/JSONL/binary workload file instead of a random one")
+    parser.add_argument("--quanta", type=int, nargs="+", default=list(range(1, 21)))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", help="reuse results stored in this directory")
+    parser.add_argument("--out", help="write the sweep table to this CSV file")
+    args = parser.parse_args(argv)
+
+    if args.workload:
+        table = load_workload(args.workload)
+    else:
+        table = random_workload(args.processes, args.seed)
+    rows = sweep_quantum(table, args.quanta, args.workers, args.cache_dir)
+
+    if args.out:
+        write_csv(rows, args.out)
+    print(f"{'quantum':>8} {'avg_tat':>12} {'avg_wt':>12} {'avg_rt':>12} {'switches':>10}")
+    for r in rows:
+        print(f"{r['quantum']:>8} {r['avg_tat']:>12.2f} {r['avg_wt']:>12.2f} "
+              f"{r['avg_rt']:>12.2f} {r['context_switches']:>10}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
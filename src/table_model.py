@@ -0,0 +1,192 @@
+# -------------------------------------------------
+# Virtualized process / result tables
+# -------------------------------------------------
+# ProcessTableModel serves a ProcessTable's NumPy columns to a QTableView.
+# Cells are formatted only when the view asks for them, i.e. for the rows
+# on screen, and sorting / filtering work on index arrays, so a million
+# rows cost a few arrays instead of millions of QTableWidgetItems.
+import operator
+import re
+from typing import Callable, List, NamedTuple, Optional
+
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtWidgets import (
+    QComboBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QTableView, QVBoxLayout, QWidget
+)
+
+from utils import UNSET, ProcessTable, as_table, seconds_to_time
+
+
+class Column(NamedTuple):
+    header: str
+    values: Callable[[ProcessTable], np.ndarray]
+    is_time: bool = False        # shown as a clock time, UNSET as "--"
+
+
+def _field(name):
+    return lambda table: getattr(table, name)
+
+
+def _tat(table):
+    return table.completion_time - table.arrival
+
+
+def _wt(table):
+    return table.completion_time - table.arrival - table.burst
+
+
+PID = Column("PID", _field("pid"))
+ARRIVAL = Column("Arrival", _field("arrival"), is_time=True)
+BURST = Column("Burst", _field("burst"))
+PRIORITY = Column("Priority", _field("priority"))
+START = Column("Start", _field("start_time"), is_time=True)
+COMPLETION = Column("Completion", _field("completion_time"), is_time=True)
+TAT = Column("TAT", _tat)
+WT = Column("WT", _wt)
+RESPONSE = Column("Response", _field("response_time"), is_time=True)
+
+
+def process_columns(show_priority: bool) -> List[Column]:
+    return [PID, ARRIVAL, BURST] + ([PRIORITY] if show_priority else [])
+
+
+def result_columns(show_priority: bool) -> List[Column]:
+    return process_columns(show_priority) + [START, COMPLETION, TAT, WT, RESPONSE]
+
+
+_COMPARISONS = {
+    "": operator.eq, "=": operator.eq, "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+_NUMERIC_FILTER = re.compile(r"^\s*(==|=|!=|<=|>=|<|>)?\s*(-?\d+)\s*$")
+
+
+def filter_mask(values: np.ndarray, text: str) -> np.ndarray:
+    """
+    Rows of `values` matching a filter string.
+
+    Numeric columns take a comparison such as `7`, `>5` or `<=10`; any
+    other text (and any text on a label column) is a substring match.
+    """
+    match = _NUMERIC_FILTER.match(text)
+    if match and values.dtype.kind in "iu":
+        op, number = match.groups()
+        return _COMPARISONS[op or ""](values, int(number))
+    return np.char.find(values.astype(str), text.strip()) >= 0
+
+
+# -------------------------------------------------
+# Model
+# -------------------------------------------------
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the columns of a ProcessTable.
+
+    `_rows` maps view rows to table rows; sort() and set_filter() only
+    rebuild that array.
+    """
+
+    def __init__(self, processes, columns: List[Column], parent=None):
+        super().__init__(parent)
+        table = as_table(processes)
+        self._columns = columns
+        self._values = [column.values(table) for column in columns]
+        self._order = np.arange(len(table))       # current sort order
+        self._mask: Optional[np.ndarray] = None   # current filter
+        self._rows = self._order
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            column = self._columns[index.column()]
+            value = self._values[index.column()][self._rows[index.row()]].item()
+            if column.is_time:
+                return seconds_to_time(None if value == UNSET else value)
+            return str(value)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section].header
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._order = np.argsort(self._values[column], kind="stable")
+        if order == Qt.DescendingOrder:
+            self._order = self._order[::-1]
+        self._apply()
+        self.layoutChanged.emit()
+
+    def set_filter(self, column: int, text: str):
+        """Show only rows whose `column` matches `text`; empty text clears the filter."""
+        self.beginResetModel()
+        self._mask = filter_mask(self._values[column], text) if text.strip() else None
+        self._apply()
+        self.endResetModel()
+
+    def _apply(self):
+        if self._mask is None:
+            self._rows = self._order
+        else:
+            self._rows = self._order[self._mask[self._order]]
+
+
+# -------------------------------------------------
+# View with a filter bar
+# -------------------------------------------------
+class ProcessTableView(QWidget):
+    """QTableView over a ProcessTableModel, with click-to-sort headers and a filter bar."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        bar = QHBoxLayout()
+        bar.addWidget(QLabel("Filter"))
+        self.filter_column = QComboBox()
+        self.filter_text = QLineEdit()
+        self.filter_text.setPlaceholderText("e.g. P12, 5, >3, <=10 (times in seconds)")
+        self.filter_column.currentIndexChanged.connect(self._refilter)
+        self.filter_text.textChanged.connect(self._refilter)
+        bar.addWidget(self.filter_column)
+        bar.addWidget(self.filter_text, 1)
+        layout.addLayout(bar)
+
+        self.view = QTableView()
+        self.view.setSortingEnabled(True)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        layout.addWidget(self.view)
+
+    def set_data(self, processes, columns: List[Column]):
+        model = ProcessTableModel(processes, columns, self)
+        self.view.setModel(model)
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+        self.filter_column.blockSignals(True)
+        self.filter_column.clear()
+        self.filter_column.addItems([column.header for column in columns])
+        self.filter_column.blockSignals(False)
+        self._refilter()
+
+    def model(self) -> Optional[ProcessTableModel]:
+        return self.view.model()
+
+    def _refilter(self):
+        model = self.model()
+        if model is not None:
+            model.set_filter(self.filter_column.currentIndex(), self.filter_text.text())
@@ -1,33 +1,229 @@
-from dataclasses import dataclass
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+
+# Sentinel stored in the integer runtime columns for "not set yet"
+UNSET = -1
 
 
-@dataclass
 class Process:
-    pid: str
-arrival: int
-burst: int
-priority: int
-remaining: Optional[int] = None
-start_time: Optional[int] = None
-completion_time: Optional[int] = None
-response_time: Optional[int] = None
-
-
-def __post_init__(self):
-    if self.remaining is None:
+    """A single process. Runtime fields are filled in by the schedulers."""
+    __slots__ = ("pid", "arrival", "burst", "priority", "remaining",
+                 "start_time", "completion_time", "response_time")
+
+    def __init__(self, pid, arrival: int, burst: int, priority: int = 1):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.reset()
+
+    def reset(self):
         self.remaining = self.burst
+        self.start_time = None
+        self.completion_time = None
+        self.response_time = None
+
+    # name used by the GUI
+    reset_runtime = reset
+
+    def __repr__(self):
+        return (f"Process(pid={self.pid!r}, arrival={self.arrival}, "
+                f"burst={self.burst}, priority={self.priority})")
+
+
+def _int_column(values, dtype, name: str) -> np.ndarray:
+    """`values` as an array of `dtype`, raising ValueError if any of them don't fit."""
+    array = np.asarray(values)
+    if array.dtype == object:
+        # Python ints too large even for int64
+        raise ValueError(f"{name} values must fit in {np.dtype(dtype).name}")
+    if array.dtype.kind in "iu" and len(array) and not np.can_cast(array.dtype, dtype):
+        info = np.iinfo(dtype)
+        lo, hi = array.min(), array.max()
+        if lo < info.min or hi > info.max:
+            bad = lo if lo < info.min else hi
+            raise ValueError(f"{name} value {bad} does not fit in {np.dtype(dtype).name}")
+    return array.astype(dtype, copy=False)
+
+
+def _column(name: str, optional: bool = False):
+    """Property that reads/writes one cell of a ProcessTable column."""
+    def get(self):
+        value = getattr(self._table, name)[self._idx].item()
+        if optional and value == UNSET:
+            return None
+        return value
+
+    def set(self, value):
+        getattr(self._table, name)[self._idx] = UNSET if value is None else value
+
+    return property(get, set)
+
+
+class ProcessRow:
+    """Thin view of one row of a ProcessTable, shaped like a Process."""
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table: "ProcessTable", idx: int):
+        self._table = table
+        self._idx = idx
+
+    pid = _column("pid")
+    arrival = _column("arrival")
+    burst = _column("burst")
+    priority = _column("priority")
+    remaining = _column("remaining")
+    start_time = _column("start_time", optional=True)
+    completion_time = _column("completion_time", optional=True)
+    response_time = _column("response_time", optional=True)
+
+    def reset(self):
+        self._table.reset(self._idx)
+
+    reset_runtime = reset
+
+    def __repr__(self):
+        return (f"ProcessRow(pid={self.pid!r}, arrival={self.arrival}, "
+                f"burst={self.burst}, priority={self.priority})")
 
 
+class ProcessTable:
+    """
+    Columnar workload: one typed NumPy array per Process field.
 
+    `arrival` is int64, so recorded traces can use epoch timestamps;
+    `burst`, `priority` and `remaining` are int32, and values that don't
+    fit raise ValueError instead of wrapping. Runtime results are int64
+    with UNSET for missing values. `pid` keeps whatever
+    dtype it was built from; integer pids are the compact choice for very
+    large workloads. Indexing or iterating yields ProcessRow views, so
+    code written against a list of Process objects keeps working.
+    """
+    __slots__ = ("pid", "arrival", "burst", "priority", "remaining",
+                 "start_time", "completion_time", "response_time")
 
-def compute_metrics(processes: List[Process]):
-    n = len(processes)
-    total_tat = sum((p.completion_time - p.arrival) for p in processes)
-    total_wt = sum((p.completion_time - p.arrival - p.burst) for p in processes)
-    total_rt = sum((p.response_time or 0) for p in processes)
+    def __init__(self, pid, arrival, burst, priority=None):
+        self.pid = np.asarray(pid)
+        self.arrival = _int_column(arrival, np.int64, "arrival")
+        self.burst = _int_column(burst, np.int32, "burst")
+        n = len(self.pid)
+        if priority is None:
+            self.priority = np.ones(n, dtype=np.int32)
+        else:
+            self.priority = _int_column(priority, np.int32, "priority")
+        if not (len(self.arrival) == len(self.burst) == len(self.priority) == n):
+            raise ValueError("ProcessTable columns must all have the same length")
+
+        self.remaining = self.burst.copy()
+        self.start_time = np.full(n, UNSET, dtype=np.int64)
+        self.completion_time = np.full(n, UNSET, dtype=np.int64)
+        self.response_time = np.full(n, UNSET, dtype=np.int64)
+
+    @classmethod
+    def from_processes(cls, processes: List[Process]) -> "ProcessTable":
+        table = cls(
+            [p.pid for p in processes],
+            [p.arrival for p in processes],
+            [p.burst for p in processes],
+            [p.priority for p in processes],
+        )
+        table.remaining[:] = [p.remaining for p in processes]
+        for name in ("start_time", "completion_time", "response_time"):
+            values = (getattr(p, name) for p in processes)
+            getattr(table, name)[:] = [UNSET if v is None else v for v in values]
+        return table
+
+    def fresh_copy(self) -> "ProcessTable":
+        """
+        Table for another run of the same workload, with its own reset
+        runtime columns. The input columns are shared, not copied; nothing
+        writes to them after construction.
+        """
+        table = ProcessTable.__new__(ProcessTable)
+        for name in ("pid", "arrival", "burst", "priority"):
+            setattr(table, name, getattr(self, name))
+        table.remaining = self.burst.copy()
+        for name in ("start_time", "completion_time", "response_time"):
+            setattr(table, name, np.full(len(self), UNSET, dtype=np.int64))
+        return table
+
+    def reset(self, idx=slice(None)):
+        self.remaining[idx] = self.burst[idx]
+        self.start_time[idx] = UNSET
+        self.completion_time[idx] = UNSET
+        self.response_time[idx] = UNSET
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, idx: int) -> ProcessRow:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessRow(self, idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield ProcessRow(self, idx)
+
+
+def as_table(processes) -> ProcessTable:
+    """Return `processes` as a ProcessTable, converting a Process list if needed."""
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_processes(processes)
+
+
+def random_workload(n: int, seed=None, max_arrival: int = 30,
+                    max_burst: int = 10, max_priority: int = 10) -> ProcessTable:
+    """
+    Random workload shaped like the GUI's generated table.
+
+    The same `seed` always gives the same table, so batch workers can
+    rebuild a workload from its seed instead of receiving it pickled.
+    """
+    rng = np.random.default_rng(seed)
+    return ProcessTable(
+        [f"P{i + 1}" for i in range(n)],
+        rng.integers(0, max_arrival, n, endpoint=True),
+        rng.integers(1, max_burst, n, endpoint=True),
+        rng.integers(1, max_priority, n, endpoint=True),
+    )
+
+
+def compute_metrics(processes) -> Dict[str, float]:
+    """Average TAT/WT/RT of a finished run, as array reductions over the table."""
+    table = as_table(processes)
+    if not len(table):
+        return {'avg_tat': 0, 'avg_wt': 0, 'avg_rt': 0}
+
+    tat = table.completion_time - table.arrival
+    wt = tat - table.burst
+    rt = np.where(table.response_time == UNSET, 0, table.response_time)
     return {
-'avg_tat': total_tat / n,
-'avg_wt': total_wt / n,
-'avg_rt': total_rt / n,
-}
+        'avg_tat': float(tat.mean()),
+        'avg_wt': float(wt.mean()),
+        'avg_rt': float(rt.mean()),
+    }
+
+
+# Wall-clock origin for displaying simulated seconds as times of day
+BASE_TIME = datetime.now().replace(microsecond=0)
+
+
+def seconds_to_time(sec):
+    if sec is None:
+        return "--"
+    try:
+        return (BASE_TIME + timedelta(seconds=int(sec))).strftime("%H:%M:%S")
+    except OverflowError:
+        # Beyond datetime's range, e.g. epoch-millisecond timestamps
+        return str(int(sec))
@@ -0,0 +1,112 @@
+# -------------------------------------------------
+# Schedules against the original implementation
+# -------------------------------------------------
+# data/baseline_schedules.json holds the gantt charts and per-process
+# start / completion / response times that the original, unoptimized
+# schedulers.py produced for a set of hand-picked and random workloads.
+# Every registered algorithm, on both a Process list and a ProcessTable,
+# and SchedulerSession must still produce exactly those.
+#
+# The one intended difference: the original Round Robin emitted one
+# segment per quantum, where the deque engine merges back-to-back slices of
+# the same process into one segment. The expected RR gantt is merged the
+# same way before comparing.
+import json
+import os
+import random
+
+import pytest
+
+from registry import ALGORITHMS
+from session import SchedulerSession
+from utils import Process, ProcessTable
+
+_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "baseline_schedules.json")
+
+with open(_DATA) as f:
+    CASES = json.load(f)["cases"]
+
+PARAMS = [pytest.param(case, algo_id, id=f"{case['name']}-{algo_id}")
+          for case in CASES for algo_id in ALGORITHMS]
+
+
+def merge_adjacent(gantt):
+    """Coalesce segments where the same pid runs on without a gap."""
+    merged = []
+    for pid, start, dur in gantt:
+        if merged and merged[-1][0] == pid and merged[-1][1] + merged[-1][2] == start:
+            merged[-1] = (pid, merged[-1][1], merged[-1][2] + dur)
+        else:
+            merged.append((pid, start, dur))
+    return merged
+
+
+def expected(case, algo_id):
+    result = case["results"][algo_id]
+    gantt = [tuple(seg) for seg in result["gantt"]]
+    if algo_id == "rr":
+        gantt = merge_adjacent(gantt)
+    return gantt, [tuple(t) for t in result["times"]]
+
+
+def params_of(case, algo_id):
+    return {"quantum": case["quantum"]} if ALGORITHMS[algo_id].params else {}
+
+
+def times_of(processes):
+    return [(p.start_time, p.completion_time, p.response_time) for p in processes]
+
+
+@pytest.mark.parametrize("case, algo_id", PARAMS)
+def test_process_list_matches_baseline(case, algo_id):
+    processes = [Process(*spec) for spec in case["processes"]]
+    gantt = ALGORITHMS[algo_id].run(processes, **params_of(case, algo_id))
+
+    want_gantt, want_times = expected(case, algo_id)
+    assert [tuple(seg) for seg in gantt] == want_gantt
+    assert times_of(processes) == want_times
+    assert all(p.remaining == 0 for p in processes)
+
+
+@pytest.mark.parametrize("case, algo_id", PARAMS)
+def test_table_stream_matches_baseline(case, algo_id):
+    table = ProcessTable(*zip(*case["processes"]))
+    gantt = list(ALGORITHMS[algo_id].stream(table, **params_of(case, algo_id)))
+
+    want_gantt, want_times = expected(case, algo_id)
+    assert gantt == want_gantt
+    assert times_of(table) == want_times
+    assert not table.remaining.any()
+
+
+@pytest.mark.parametrize("case, algo_id", PARAMS)
+def test_session_drain_matches_baseline(case, algo_id):
+    processes = [Process(*spec) for spec in case["processes"]]
+    session = SchedulerSession(algo_id, **params_of(case, algo_id))
+    for p in processes:
+        session.submit(p)
+    session.drain()
+
+    want_gantt, want_times = expected(case, algo_id)
+    assert session.gantt == want_gantt
+    assert times_of(processes) == want_times
+    assert session.pending == 0
+
+
+@pytest.mark.parametrize("case, algo_id", PARAMS)
+def test_session_online_matches_baseline(case, algo_id):
+    # Submit each process only once the clock reaches its arrival, with
+    # extra stops in between; the result must not depend on the stops
+    rnd = random.Random(case["name"])
+    processes = [Process(*spec) for spec in case["processes"]]
+    session = SchedulerSession(algo_id, **params_of(case, algo_id))
+    for p in sorted(processes, key=lambda p: p.arrival):
+        if p.arrival > session.now and rnd.random() < 0.5:
+            session.advance(rnd.randint(session.now, p.arrival))
+        session.advance(p.arrival)
+        session.submit(p)
+    session.drain()
+
+    want_gantt, want_times = expected(case, algo_id)
+    assert session.gantt == want_gantt
+    assert times_of(processes) == want_times
@@ -0,0 +1,92 @@
+# -------------------------------------------------
+# Binary Gantt traces
+# -------------------------------------------------
+# A trace written to disk and read back through the memory-mapped reader
+# must give back exactly the in-memory gantt, and the metrics derived from
+# it must match those of the scheduled processes.
+import numpy as np
+import pytest
+
+from gantt_trace import (HEADER_SIZE, RECORD, TraceWriter, _BATCH, read_trace,
+                         trace_metrics, write_trace)
+from registry import ALGORITHMS
+from utils import ProcessTable, compute_metrics, random_workload
+
+
+def scheduled(algo_id, n=300, seed=0, pids=None):
+    table = random_workload(n, seed=seed)
+    if pids is not None:
+        table = ProcessTable(pids, table.arrival, table.burst, table.priority)
+    algo = ALGORITHMS[algo_id]
+    gantt = algo.run(table, **({"quantum": 2} if algo.params else {}))
+    return table, gantt
+
+
+@pytest.mark.parametrize("algo_id", list(ALGORITHMS))
+def test_round_trip_matches_in_memory_gantt(tmp_path, algo_id):
+    table, gantt = scheduled(algo_id)
+    trace = read_trace(write_trace(tmp_path / "run.gntt", gantt))
+
+    assert len(trace) == len(gantt)
+    assert list(trace) == gantt
+    assert trace[0] == gantt[0] and trace[-1] == gantt[-1]
+    assert isinstance(trace.records, np.memmap)
+    assert trace.end_time() == max(start + dur for _, start, dur in gantt)
+    assert trace_metrics(trace, table) == pytest.approx(compute_metrics(table))
+
+
+@pytest.mark.parametrize("pids", [np.arange(100, 400), np.array([i if i % 2 else f"P{i}"
+                                                                   for i in range(300)],
+                                                                  dtype=object)])
+def test_pid_types_survive_the_round_trip(tmp_path, pids):
+    table, gantt = scheduled("rr", pids=pids)
+    trace = read_trace(write_trace(tmp_path / "run.gntt", gantt))
+    assert [(type(pid), pid) for pid, _, _ in trace] == [(type(pid), pid) for pid, _, _ in gantt]
+
+
+def test_streamed_trace_spanning_several_batches(tmp_path):
+    table = random_workload(3 * _BATCH // 2, seed=2, max_arrival=10 ** 6)
+    table.pid = np.arange(len(table))
+    path = tmp_path / "big.gntt"
+    with TraceWriter(path) as writer:
+        writer.write_many(ALGORITHMS["fcfs"].stream(table))
+    gantt = ALGORITHMS["fcfs"].run(table.fresh_copy())
+
+    trace = read_trace(path)
+    assert path.stat().st_size > HEADER_SIZE + len(gantt) * RECORD.itemsize
+    assert len(trace) == len(gantt) > _BATCH
+    assert np.array_equal(trace.start, [start for _, start, _ in gantt])
+    assert list(trace) == gantt
+
+    first, completion, executed = trace.process_times()
+    rows = np.array(trace.pids)
+    assert np.array_equal(first, table.start_time[rows])
+    assert np.array_equal(completion, table.completion_time[rows])
+    assert np.array_equal(executed, table.burst[rows])
+
+
+def test_empty_trace(tmp_path):
+    trace = read_trace(write_trace(tmp_path / "empty.gntt", []))
+    assert len(trace) == 0
+    assert list(trace) == [] and trace.pids == []
+    assert trace.end_time() == 0
+    assert [len(column) for column in trace.process_times()] == [0, 0, 0]
+    assert trace_metrics(trace, ProcessTable([], [], [])) == {"avg_tat": 0, "avg_wt": 0,
+                                                              "avg_rt": 0}
+
+
+def test_writer_creates_missing_directories(tmp_path):
+    path = tmp_path / "a" / "b" / "run.gntt"
+    write_trace(path, [("P1", 0, 3)])
+    assert list(read_trace(path)) == [("P1", 0, 3)]
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"GN", "file too short"),
+    (b"XXXX" + bytes(HEADER_SIZE), "bad magic"),
+])
+def test_reader_rejects_other_files(tmp_path, data, message):
+    path = tmp_path / "bad.gntt"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match=message):
+        read_trace(path)
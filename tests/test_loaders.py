@@ -0,0 +1,124 @@
+# -------------------------------------------------
+# Workload loaders
+# -------------------------------------------------
+# CSV and JSONL must accept and reject the same workloads, and every
+# rejection is a ValueError naming the file and the offending line.
+import re
+
+import numpy as np
+import pytest
+
+from loaders import load_csv, load_jsonl, load_workload, save_binary
+from utils import ProcessTable
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def jsonl(*rows):
+    return "".join(row + "\n" for row in rows)
+
+
+# ---------------------------------------------
+# Accepted input
+# ---------------------------------------------
+def test_csv_and_jsonl_load_the_same_table(tmp_path):
+    csv = write(tmp_path, "w.csv", "pid,arrival,burst,priority\n1,0,3,2\n2,4,1,1\n")
+    lines = write(tmp_path, "w.jsonl", jsonl('{"pid":1,"arrival":0,"burst":3,"priority":2}',
+                                             '{"pid":2,"arrival":4,"burst":1,"priority":1}'))
+    a, b = load_csv(csv), load_jsonl(lines)
+    for name in ("pid", "arrival", "burst", "priority"):
+        assert np.array_equal(getattr(a, name), getattr(b, name))
+    assert a.pid.dtype == b.pid.dtype == np.int64
+
+
+def test_integer_pids_from_csv_can_be_saved_as_binary(tmp_path):
+    table = load_csv(write(tmp_path, "w.csv", "pid,arrival,burst\n7,0,3\n9,1,2\n"))
+    save_binary(table, tmp_path / "w.bin")
+    assert load_workload(tmp_path / "w.bin").pid.tolist() == [7, 9]
+
+
+@pytest.mark.parametrize("pids", [["P1", "P22"], ["007", "7"]])
+def test_label_pids_stay_strings(tmp_path, pids):
+    rows = "".join(f"{pid},{i},1\n" for i, pid in enumerate(pids))
+    table = load_csv(write(tmp_path, "w.csv", "pid,arrival,burst\n" + rows))
+    assert table.pid.tolist() == pids
+
+
+def test_jsonl_skips_blank_lines_across_chunks(tmp_path):
+    path = write(tmp_path, "w.jsonl", jsonl("", "", "", '{"arrival":1,"burst":2}', ""))
+    assert len(load_jsonl(path, chunk_rows=2)) == 1
+
+
+def test_large_arrivals_load_unchanged(tmp_path):
+    table = load_csv(write(tmp_path, "w.csv", "arrival,burst\n99999999999,3\n"))
+    assert table.arrival.tolist() == [99999999999]
+
+
+# ---------------------------------------------
+# Rejected input
+# ---------------------------------------------
+@pytest.mark.parametrize("rows, message", [
+    (['{"pid":"A","arrival":0,"burst":3}', '{"pid":"B","arrival":1}'],
+     "line 2: missing 'burst'"),
+    (['{"pid":"A","arrival":0,"burst":3}', '{"pid":"B","arrival":null,"burst":2}'],
+     "line 2: 'arrival' must be an integer, got null"),
+    (['{"pid":"A","arrival":0,"burst":1.5}'], "line 1: 'burst' must be an integer, got 1.5"),
+    (['{"pid":"A","arrival":true,"burst":1}'], "line 1: 'arrival' must be an integer, got true"),
+    (['{"pid":"A","arrival":0,"burst":3}', '{"pid":"B","arrival":1,"burst":2,"priority":3}'],
+     "line 2: 'priority' is not in the first row"),
+    (['{"pid":"A","arrival":0,"burst":3,"priority":1}', '{"pid":"B","arrival":1,"burst":2}'],
+     "line 2: missing 'priority'"),
+    (['{"pid":1,"arrival":0,"burst":3}', '{"pid":"B","arrival":1,"burst":2}'],
+     "line 2: 'pid' must be an integer like the first row's"),
+    (['{"pid":"A","arrival":0,"burst":3}', '{"pid":2,"arrival":1,"burst":2}'],
+     "line 2: 'pid' must be a string like the first row's"),
+    (['{"pid":"A","arrival":0,"burst":3}', '{"pid":"B",'], "line 2: Expecting"),
+    (['{"arrival":0,"burst":1}', '[1,2]'], "line 2: expected a JSON object"),
+    (['{"arrival":0,"burst":1}', '{"arrival":0,"burst":99999999999999999999}'],
+     "line 2: 'burst' does not fit in int64"),
+    (['{"arrival":0,"burst":3}', '', '{"arrival":1,"burst":0}'],
+     "line 3: 'burst' must be at least 1, got 0"),
+    (['{"arrival":0,"burst":-2}'], "line 1: 'burst' must be at least 1, got -2"),
+])
+def test_jsonl_rejects(tmp_path, rows, message):
+    path = write(tmp_path, "w.jsonl", jsonl(*rows))
+    with pytest.raises(ValueError, match=f"^{re.escape(str(path))}: {message}"):
+        load_jsonl(path)
+
+
+def test_jsonl_reports_lines_past_the_first_chunk(tmp_path):
+    rows = ['{"arrival":%d,"burst":1}' % i for i in range(10)] + ["", '{"arrival":1}']
+    path = write(tmp_path, "w.jsonl", jsonl(*rows))
+    with pytest.raises(ValueError, match="line 12: missing 'burst'"):
+        load_jsonl(path, chunk_rows=3)
+
+
+@pytest.mark.parametrize("text, message", [
+    ("pid,arrival,burst\nA,0,1.5\n", "could not convert string '1.5'"),
+    ("pid,arrival,burst,priority\nA,0,1,\n", "could not convert string ''"),
+    ("pid,arrival,burst\nA,0,3\n\n# comment\nB,1,0\n", "line 5: 'burst' must be at least 1, got 0"),
+    ("pid,arrival,burst\nA,0,-1\n", "line 2: 'burst' must be at least 1, got -1"),
+    ("pid,arrival\nA,0\n", "missing required column"),
+])
+def test_csv_rejects(tmp_path, text, message):
+    path = write(tmp_path, "w.csv", text)
+    with pytest.raises(ValueError, match=f"^{re.escape(str(path))}: .*{message}"):
+        load_csv(path)
+
+
+def test_binary_rejects_zero_burst(tmp_path):
+    path = tmp_path / "w.bin"
+    save_binary(ProcessTable(np.arange(3), [0, 1, 2], [1, 0, 3]), path)
+    with pytest.raises(ValueError, match="record 2: 'burst' must be at least 1"):
+        load_workload(path)
+
+
+def test_burst_outside_int32_is_rejected(tmp_path):
+    path = write(tmp_path, "w.jsonl", jsonl('{"arrival":0,"burst":9999999999}'))
+    with pytest.raises(ValueError, match=f"^{re.escape(str(path))}: burst value 9999999999 "
+                                         "does not fit in int32"):
+        load_jsonl(path)
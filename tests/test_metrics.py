@@ -0,0 +1,120 @@
+# -------------------------------------------------
+# Streaming metrics
+# -------------------------------------------------
+# The sketch's quantiles must be within its advertised relative error
+# `alpha` of the exact ones, and merging accumulators must give the same
+# summary as feeding everything into one.
+import numpy as np
+import pytest
+
+from metrics import QUANTILES, MetricsAccumulator, QuantileSketch
+from registry import ALGORITHMS
+from utils import compute_metrics, random_workload
+
+
+def exact_quantile(values, q):
+    # The sketch returns the bucket holding the value at rank
+    # floor(q * (n - 1)), so compare against that value, not an interpolation
+    return float(np.quantile(values, q, method="lower"))
+
+
+def assert_within_alpha(got, want, alpha):
+    assert abs(got - want) <= alpha * abs(want), (got, want)
+
+
+# ---------------------------------------------
+# QuantileSketch
+# ---------------------------------------------
+@pytest.mark.parametrize("alpha", [0.01, 0.05])
+@pytest.mark.parametrize("dist", ["uniform", "lognormal", "integers"])
+def test_sketch_quantiles_within_relative_error(alpha, dist):
+    rng = np.random.default_rng(3)
+    values = {
+        "uniform": lambda: rng.uniform(0.5, 1000, 20_000),
+        "lognormal": lambda: rng.lognormal(3, 2, 20_000),
+        "integers": lambda: rng.integers(0, 500, 20_000).astype(float),
+    }[dist]()
+    sketch = QuantileSketch(alpha)
+    sketch.add_many(values)
+    for q in (0.0, 0.1, 0.5, 0.9, 0.95, 0.99, 1.0):
+        assert_within_alpha(sketch.quantile(q), exact_quantile(values, q), alpha)
+
+
+def test_sketch_add_and_add_many_agree():
+    values = np.random.default_rng(5).integers(0, 100, 1000)
+    one, many = QuantileSketch(), QuantileSketch()
+    for v in values:
+        one.add(int(v))
+    many.add_many(values)
+    assert (one.count, one.zero, one.buckets) == (many.count, many.zero, many.buckets)
+
+
+def test_sketches_with_different_alpha_do_not_merge():
+    with pytest.raises(ValueError):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+def test_empty_sketch():
+    assert QuantileSketch().quantile(0.5) == 0.0
+
+
+# ---------------------------------------------
+# MetricsAccumulator
+# ---------------------------------------------
+def finished_run(n, seed, algo_id="rr"):
+    table = random_workload(n, seed=seed, max_arrival=n)
+    ALGORITHMS[algo_id].run(table, **({"quantum": 3} if algo_id == "rr" else {}))
+    return table
+
+
+def accumulate(tables):
+    acc = MetricsAccumulator()
+    for table in tables:
+        acc.add_many(table.arrival, table.burst, table.start_time, table.completion_time)
+    return acc
+
+
+@pytest.mark.parametrize("algo_id", list(ALGORITHMS))
+def test_summary_matches_exact_metrics(algo_id):
+    table = finished_run(5000, seed=1, algo_id=algo_id)
+    summary = accumulate([table]).summary()
+
+    tat = table.completion_time - table.arrival
+    exact = {"tat": tat, "wt": tat - table.burst, "rt": table.start_time - table.arrival}
+    for key, value in compute_metrics(table).items():
+        assert summary[key] == pytest.approx(value)
+    for name, values in exact.items():
+        assert summary[f"std_{name}"] == pytest.approx(values.std())
+        assert summary[f"max_{name}"] == values.max()
+        for q in QUANTILES:
+            assert_within_alpha(summary[f"p{round(q * 100)}_{name}"],
+                                exact_quantile(values, q), 0.01)
+
+
+def test_engine_metrics_match_a_pass_over_the_results():
+    table = random_workload(2000, seed=7)
+    acc = MetricsAccumulator()
+    ALGORITHMS["rr"].run(table, metrics=acc, quantum=2)
+    assert acc.summary() == pytest.approx(accumulate([table]).summary())
+
+
+def test_merged_accumulators_match_a_single_pass():
+    tables = [finished_run(n, seed) for seed, n in enumerate((300, 1, 2000, 0, 750))]
+    merged = MetricsAccumulator()
+    for table in tables:
+        merged.merge(accumulate([table]))
+
+    single = MetricsAccumulator()
+    for table in tables:
+        for p in table:
+            single.add(p.arrival, p.burst, p.start_time, p.completion_time)
+
+    assert merged.count == single.count == sum(map(len, tables))
+    assert merged.summary() == pytest.approx(single.summary())
+    for name in ("tat", "wt", "rt"):
+        assert getattr(merged, name).sketch.buckets == getattr(single, name).sketch.buckets
+
+
+def test_empty_accumulator_summary():
+    summary = MetricsAccumulator().summary()
+    assert summary["avg_tat"] == summary["p99_rt"] == summary["max_wt"] == 0
@@ -0,0 +1,158 @@
+# -------------------------------------------------
+# Result cache
+# -------------------------------------------------
+# Hits replay exactly what a fresh run produces, the memory layer evicts
+# the least recently used runs, and the disk layer stays within its size
+# budget.
+import os
+
+import numpy as np
+import pytest
+
+from registry import ALGORITHMS
+from result_cache import CachedRun, ResultCache, cache_key
+from utils import ProcessTable, random_workload
+
+
+def run_of(n, seed=0):
+    table = random_workload(n, seed=seed)
+    gantt = ALGORITHMS["fcfs"].run(table)
+    return CachedRun.from_run(gantt, table)
+
+
+def results(table):
+    return [(p.start_time, p.completion_time, p.response_time, p.remaining) for p in table]
+
+
+# ---------------------------------------------
+# Keys
+# ---------------------------------------------
+def test_key_is_stable_across_equal_workloads():
+    a, b = random_workload(50, seed=1), random_workload(50, seed=1)
+    assert cache_key(a, "rr", {"quantum": 2}) == cache_key(b, "rr", {"quantum": 2})
+
+
+@pytest.mark.parametrize("change", ["algo", "param", "burst", "pid"])
+def test_key_changes_with_the_run(change):
+    table = random_workload(50, seed=1)
+    before = cache_key(table, "rr", {"quantum": 2})
+    algo, params = "rr", {"quantum": 2}
+    if change == "algo":
+        algo = "fcfs"
+    elif change == "param":
+        params = {"quantum": 3}
+    elif change == "burst":
+        table.burst[7] += 1
+        table.remaining[7] += 1
+    else:
+        table.pid[7] = "X"
+    assert cache_key(table, algo, params) != before
+
+
+# ---------------------------------------------
+# Hits and misses
+# ---------------------------------------------
+@pytest.mark.parametrize("algo_id", list(ALGORITHMS))
+def test_hit_replays_the_original_run(algo_id):
+    algo = ALGORITHMS[algo_id]
+    params = {"quantum": 3} if algo.params else {}
+    cache = ResultCache()
+
+    first = random_workload(200, seed=4)
+    want = algo.run(first, cache=cache, **params)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = random_workload(200, seed=4)
+    assert algo.run(second, cache=cache, **params) == want
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert results(second) == results(first)
+
+
+def test_partly_consumed_stream_is_not_stored():
+    cache = ResultCache()
+    stream = ALGORITHMS["fcfs"].stream(random_workload(20, seed=2), cache=cache)
+    next(stream)
+    stream.close()
+    assert len(cache) == 0
+
+
+# ---------------------------------------------
+# Memory layer
+# ---------------------------------------------
+def test_memory_evicts_least_recently_used_entry():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", run_of(5))
+    cache.put("b", run_of(5))
+    cache.get("a")
+    cache.put("c", run_of(5))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_memory_stays_within_max_bytes():
+    run = run_of(100)
+    cache = ResultCache(max_bytes=3 * run.nbytes)
+    for key in "abcdef":
+        cache.put(key, run_of(100))
+    assert len(cache) == 3
+    assert cache._bytes <= cache.max_bytes
+    assert [cache.get(key) is not None for key in "abcdef"] == [False] * 3 + [True] * 3
+
+
+def test_run_larger_than_memory_budget_is_not_kept():
+    run = run_of(100)
+    cache = ResultCache(max_bytes=run.nbytes - 1)
+    cache.put("a", run)
+    assert len(cache) == 0
+
+
+# ---------------------------------------------
+# Disk layer
+# ---------------------------------------------
+def test_disk_hit_from_another_cache(tmp_path):
+    ResultCache(disk_dir=tmp_path).put("a", run_of(30))
+    other = ResultCache(disk_dir=tmp_path)
+    run = other.get("a")
+    assert run is not None and run.gantt() == run_of(30).gantt()
+    assert other.hits == 1
+
+
+def test_cheap_runs_stay_in_memory(tmp_path):
+    cache = ResultCache(disk_dir=tmp_path, min_disk_cost=1.0)
+    cache.put("a", run_of(30), cost=0.001)
+    assert cache.get("a") is not None
+    assert not list(tmp_path.glob("*.npz"))
+
+
+def test_disk_is_trimmed_to_max_disk_bytes(tmp_path):
+    probe = ResultCache(disk_dir=tmp_path / "probe")
+    probe.put("a", run_of(100))
+    size = next((tmp_path / "probe").glob("*.npz")).stat().st_size
+
+    cache = ResultCache(disk_dir=tmp_path / "c", max_disk_bytes=3 * size)
+    for i, key in enumerate("abcdef"):
+        cache.put(key, run_of(100))
+        # Distinct mtimes, so "least recently used" is well defined
+        os.utime(cache._path(key), (i, i))
+
+    files = sorted(path.stem for path in (tmp_path / "c").glob("*.npz"))
+    assert sum((tmp_path / "c" / f"{key}.npz").stat().st_size for key in files) <= 3 * size
+    assert files == ["d", "e", "f"]
+
+
+def test_corrupt_file_is_a_miss(tmp_path):
+    cache = ResultCache(disk_dir=tmp_path)
+    (tmp_path / "a.npz").write_bytes(b"not a zip file")
+    assert cache.get("a") is None
+    assert cache.misses == 1
+    assert not (tmp_path / "a.npz").exists()
+
+
+def test_mixed_pids_stay_in_memory(tmp_path):
+    table = ProcessTable(np.array([1, "B"], dtype=object), [0, 1], [2, 3])
+    run = CachedRun.from_run(ALGORITHMS["fcfs"].run(table), table)
+    cache = ResultCache(disk_dir=tmp_path)
+    assert run.gantt() == [(1, 0, 2), ("B", 2, 3)]
+    cache.put("a", run)
+    assert cache.get("a") is run
+    assert not list(tmp_path.glob("*.npz"))
@@ -0,0 +1,36 @@
+# -------------------------------------------------
+# Round Robin quantum sweep
+# -------------------------------------------------
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from registry import ALGORITHMS
+from sweep import _block_size, _table_view, context_switches, sweep_quantum
+from utils import compute_metrics, random_workload
+
+
+def test_table_columns_are_views_of_the_shared_block():
+    n = 1001
+    shm = shared_memory.SharedMemory(create=True, size=_block_size(n))
+    try:
+        block = np.ndarray(_block_size(n), dtype=np.uint8, buffer=shm.buf)
+        table = _table_view(shm.buf, n)
+        for name in ("pid", "arrival", "burst", "priority"):
+            assert np.shares_memory(getattr(table, name), block), name
+        del table, block
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep_matches_direct_runs(workers):
+    quanta = [1, 3, 8]
+    rows = sweep_quantum(random_workload(2000, seed=3), quanta, workers=workers)
+    for q, row in zip(quanta, rows):
+        table = random_workload(2000, seed=3)
+        gantt = ALGORITHMS["rr"].run(table, quantum=q)
+        assert row == {"quantum": q, **compute_metrics(table),
+                       "context_switches": context_switches(gantt)}